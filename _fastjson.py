@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+JSON helpers shared by the test scripts
+orjson encodes, parses and pretty-prints several times faster than the
+standard library; json is used when it isn't installed.
+"""
+
+import json
+
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+
+    def pretty(obj):
+        """Return obj as indented JSON text"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj):
+        """Return obj as JSON bytes"""
+        return json.dumps(obj).encode()
+
+    def pretty(obj):
+        """Return obj as indented JSON text"""
+        return json.dumps(obj, indent=2)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Keep-alive requests.Session shared by the test scripts
+Only failed connects are retried: a POST that reached the server may already
+be running (the TPU proxy serves one request at a time), so it is never resent.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def new_session(connect_retries=0):
+    """Return a pooled session that retries failed connects connect_retries times"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=connect_retries,
+            connect=connect_retries,
+            read=0,
+            status=0,
+            backoff_factor=0.5,
+        ),
+    ))
+    return session
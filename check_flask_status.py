@@ -1,36 +1,55 @@
 #!/usr/bin/env python3
 """Check Flask LLM server status and queue"""
-import requests
+import asyncio
+import httpx
 
 FLASK_URL = "http://192.168.1.60:8000"
 
-print("🔍 Checking Flask LLM Server Status")
-print("="*60)
-
-# Try to get server info
-try:
-    # Check if server is alive
-    resp = requests.get(f"{FLASK_URL}/health", timeout=5)
-    print(f"✅ Server is responding: {resp.status_code}")
-except:
-    print("❌ Server not responding on /health")
-
-# Try to get any status endpoint
-try:
-    resp = requests.get(f"{FLASK_URL}/status", timeout=5)
-    if resp.status_code == 200:
-        print(f"Status: {resp.json()}")
-except:
-    print("⚠️  No /status endpoint")
-
-# Try to reset/clear queue if endpoint exists
-try:
-    resp = requests.post(f"{FLASK_URL}/api/reset", json={}, timeout=5)
-    print(f"Reset response: {resp.status_code}")
-except:
-    print("⚠️  No /api/reset endpoint")
-
-print("\n💡 Recommendations:")
-print("1. Restart the Flask server to clear any queued requests")
-print("2. Make sure only ONE request is sent at a time")
-print("3. The TPU can take 60-120 seconds per request")
+async def main():
+    print("🔍 Checking Flask LLM Server Status")
+    print("="*60)
+
+    async with httpx.AsyncClient(timeout=5.0, base_url=FLASK_URL) as client:
+        # The read-only probes run concurrently over one connection pool
+        health, status = await asyncio.gather(
+            client.get("/health"),              # Check if server is alive
+            client.get("/status"),              # Try to get any status endpoint
+            return_exceptions=True
+        )
+
+        # Only transport errors mean an endpoint is unreachable; anything else is a bug
+        for result in (health, status):
+            if isinstance(result, Exception) and not isinstance(result, httpx.HTTPError):
+                raise result
+
+        # The reset only runs after the status has been read
+        try:
+            reset = await client.post("/api/reset", json={}) # Try to reset/clear queue if endpoint exists
+        except httpx.HTTPError as e:
+            reset = e
+
+    if isinstance(health, httpx.HTTPError):
+        print("❌ Server not responding on /health")
+    else:
+        print(f"✅ Server is responding: {health.status_code}")
+
+    if isinstance(status, httpx.HTTPError):
+        print("⚠️  No /status endpoint")
+    elif status.status_code == 200:
+        try:
+            print(f"Status: {status.json()}")
+        except ValueError:
+            print("⚠️  No /status endpoint")
+
+    if isinstance(reset, httpx.HTTPError):
+        print("⚠️  No /api/reset endpoint")
+    else:
+        print(f"Reset response: {reset.status_code}")
+
+    print("\n💡 Recommendations:")
+    print("1. Restart the Flask server to clear any queued requests")
+    print("2. Make sure only ONE request is sent at a time")
+    print("3. The TPU can take 60-120 seconds per request")
+
+if __name__ == "__main__":
+    asyncio.run(main())
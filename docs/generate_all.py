@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Generate all Artificial Mind solution architecture documents.
+Builds the docx and pptx artifacts concurrently in separate processes;
+each generator script remains usable standalone.
+"""
+
+import importlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+GENERATORS = {
+    "docx": "generate_solution_arch_docx",
+    "pptx": "generate_solution_arch_ppt",
+}
+
+
+def _run(kind: str) -> None:
+    if DOCS_DIR not in sys.path:
+        sys.path.insert(0, DOCS_DIR)
+    module = importlib.import_module(GENERATORS[kind])
+    module.main()
+
+
+def main() -> None:
+    # The pptx generator writes relative to the repository root
+    os.chdir(os.path.dirname(DOCS_DIR))
+    with ProcessPoolExecutor(max_workers=len(GENERATORS)) as ex:
+        list(ex.map(_run, GENERATORS))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import functools
+import hashlib
 import os
 import sys
 from datetime import datetime
@@ -12,7 +14,9 @@ except ImportError as e:
     raise
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SKELETON_DIR = os.path.join(ROOT, 'docs', '.cache')
 
+@functools.lru_cache(maxsize=None)
 def read_file(path: str) -> str:
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -20,6 +24,9 @@ def read_file(path: str) -> str:
     except FileNotFoundError:
         return ""
 
+def truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit] + '...'
+
 def add_heading(doc: Document, text: str, level: int = 1):
     h = doc.add_heading(text, level=level)
     return h
@@ -41,12 +48,29 @@ def add_bullets(doc: Document, items):
 def section_divider(doc: Document):
     doc.add_page_break()
 
-def build_document():
-    doc = Document()
+def source_digest() -> str:
+    """Hash this generator's source."""
+    return hashlib.sha256(read_file(os.path.abspath(__file__)).encode('utf-8')).hexdigest()
 
-    # Title
+def build_skeleton() -> Document:
+    """Static title page, reused until this generator's source changes."""
+    # Keyed by the source hash so an edited title never reuses a stale skeleton
+    name = f'skeleton-{source_digest()[:16]}.docx'
+    path = os.path.join(SKELETON_DIR, name)
+    if os.path.exists(path):
+        return Document(path)
+
+    doc = Document()
     title = doc.add_heading('Artificial Mind Solution Architecture', level=0)
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    os.makedirs(SKELETON_DIR, exist_ok=True)
+    for old in os.listdir(SKELETON_DIR):
+        if old.startswith('skeleton') and old.endswith('.docx'):
+            os.remove(os.path.join(SKELETON_DIR, old))
+    doc.save(path)
+    return doc
+
+def fill_content(doc: Document):
     add_paragraph(doc, f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%SZ')} (UTC)")
 
     # Inputs
@@ -61,7 +85,7 @@ def build_document():
     add_heading(doc, 'High-Level Architecture', level=2)
     if sys_overview_md:
         add_paragraph(doc, 'Overview (from SYSTEM_OVERVIEW.md):', bold=True)
-        add_paragraph(doc, sys_overview_md[:2000] + ('...' if len(sys_overview_md) > 2000 else ''))
+        add_paragraph(doc, truncate(sys_overview_md, 2000))
     else:
         add_bullets(doc, [
             'Cognition & Policy: FSM, Self-Model & Goal Manager, Principles Server',
@@ -127,7 +151,7 @@ def build_document():
     add_heading(doc, 'Viability Summary', level=1)
     if summary_md:
         add_paragraph(doc, 'Highlights (from SUMMARY.md):', bold=True)
-        add_paragraph(doc, summary_md[:3000] + ('...' if len(summary_md) > 3000 else ''))
+        add_paragraph(doc, truncate(summary_md, 3000))
     else:
         add_bullets(doc, [
             'Self-improving loop of learning, caching, and capability reuse',
@@ -137,12 +161,33 @@ def build_document():
 
     return doc
 
+def build_document():
+    return fill_content(build_skeleton())
+
+def inputs_digest() -> str:
+    """Hash the markdown inputs and this generator's source."""
+    key = hashlib.sha256()
+    for name in ('SUMMARY.md', 'ARCHITECTURE.md', 'SYSTEM_OVERVIEW.md'):
+        key.update(read_file(os.path.join(ROOT, name)).encode('utf-8'))
+    key.update(source_digest().encode('utf-8'))
+    return key.hexdigest()
+
 def main():
     out_dir = os.path.join(ROOT, 'docs')
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, 'AGI_Solution_Architecture.docx')
+    digest_path = out_path + '.sha256'
+
+    # Skip the rebuild when inputs are unchanged since the last run
+    digest = inputs_digest()
+    if os.path.exists(out_path) and read_file(digest_path).strip() == digest:
+        print(out_path)
+        return
+
     doc = build_document()
     doc.save(out_path)
+    with open(digest_path, "w", encoding="utf-8") as f:
+        f.write(digest)
     print(out_path)
 
 if __name__ == '__main__':
@@ -7,11 +7,16 @@ Creates docs/Artificial_Mind_Solution_Architecture.pptx with sections:
   - Technical Architecture
 """
 
+import hashlib
+import os
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT
 from pptx.dml.color import RGBColor
 
+SKELETON_DIR = "docs/.cache"
+
 
 def add_title_slide(prs: Presentation, title: str, subtitle: str) -> None:
     slide_layout = prs.slide_layouts[0]
@@ -44,7 +49,13 @@ def add_section_header(prs: Presentation, title: str) -> None:
     run.font.color.rgb = RGBColor(0x22, 0x22, 0x22)
 
 
-def build_deck() -> Presentation:
+def build_skeleton() -> Presentation:
+    """Static title slide, reused until this generator's source changes."""
+    # Keyed by the source hash so an edited title never reuses a stale skeleton
+    path = os.path.join(SKELETON_DIR, f"skeleton-{source_digest()[:16]}.pptx")
+    if os.path.exists(path):
+        return Presentation(path)
+
     prs = Presentation()
 
     # 1) Title
@@ -53,7 +64,15 @@ def build_deck() -> Presentation:
         title="Artificial Mind Solution Architecture",
         subtitle="Context, High-Level View, Components, and Technical Architecture",
     )
+    os.makedirs(SKELETON_DIR, exist_ok=True)
+    for old in os.listdir(SKELETON_DIR):
+        if old.startswith("skeleton") and old.endswith(".pptx"):
+            os.remove(os.path.join(SKELETON_DIR, old))
+    prs.save(path)
+    return prs
+
 
+def fill_content(prs: Presentation) -> Presentation:
     # 2) Context
     add_section_header(prs, "Context & Objectives")
     add_bullets_slide(
@@ -199,10 +218,32 @@ def build_deck() -> Presentation:
     return prs
 
 
+def build_deck() -> Presentation:
+    return fill_content(build_skeleton())
+
+
+def source_digest() -> str:
+    """Hash this generator's source; the deck content lives entirely in it."""
+    with open(os.path.abspath(__file__), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
 def main() -> None:
-    prs = build_deck()
     output = "docs/Artificial_Mind_Solution_Architecture.pptx"
+    digest_path = output + ".sha256"
+
+    # Skip the rebuild when the generator is unchanged since the last run
+    digest = source_digest()
+    if os.path.exists(output) and os.path.exists(digest_path):
+        with open(digest_path, "r", encoding="utf-8") as f:
+            if f.read().strip() == digest:
+                print(f"✅ Up to date {output}")
+                return
+
+    prs = build_deck()
     prs.save(output)
+    with open(digest_path, "w", encoding="utf-8") as f:
+        f.write(digest)
     print(f"✅ Generated {output}")
 
 
@@ -3,48 +3,196 @@
 Fixed TPU Proxy for Qwen2.5-1.5B on AX650
 Works with Flask server that returns complete responses from /api/generate
 """
+import asyncio
 import httpx
-import json
+import orjson
+import re
 import time
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-app = FastAPI()
+class SSEPassthroughGZipMiddleware:
+    """GZip responses except text/event-stream, which is sent on unbuffered"""
+
+    def __init__(self, app, **gzip_options):
+        self.app = app
+        self.gzip_options = gzip_options
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def app_with_sse_bypass(scope, receive, gzip_send):
+            passthrough = False
+
+            async def route_send(message):
+                nonlocal passthrough
+                if message["type"] == "http.response.start":
+                    passthrough = any(
+                        name.lower() == b"content-type" and value.startswith(b"text/event-stream")
+                        for name, value in message.get("headers", [])
+                    )
+                await (send if passthrough else gzip_send)(message)
+
+            await self.app(scope, receive, route_send)
+
+        await GZipMiddleware(app_with_sse_bypass, **self.gzip_options)(scope, receive, send)
+
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(SSEPassthroughGZipMiddleware, minimum_size=512)
 LLM_ORIGIN = "http://127.0.0.1:8000"
-client = httpx.AsyncClient(timeout=300.0)  # 5 minute timeout for slow TPU
+# Single pooled client shared by all handlers so connections to the Flask
+# server are kept alive across requests. The limits go on the transport:
+# httpx ignores client-level limits= when a transport is passed
+client = httpx.AsyncClient(
+    timeout=httpx.Timeout(300.0, connect=5.0),  # 5 minute timeout for slow TPU
+    transport=httpx.AsyncHTTPTransport(
+        retries=1,
+        http2=False,
+        limits=httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=600.0
+        )
+    )
+)
 
 # Define tags to remove
 THINK_START = "<think>"
 THINK_END = "</think>"
+_THINK_RE = re.compile(r"</?think>")
+
+# Prompt prefix for each chat role
+ROLE_PREFIX = {
+    "system": "Instructions: ",
+    "user": "User: ",
+    "assistant": "Assistant: "
+}
 
 def clean_response(text):
     """Remove think tags from response"""
-    return text.replace(THINK_START, "").replace(THINK_END, "")
+    return _THINK_RE.sub("", text)
+
+def sse_format(request_id, created, delta, finish_reason=None):
+    """Format one OpenAI chat.completion.chunk as an SSE event"""
+    chunk = {
+        "id": request_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": "qwen2.5-1.5b-ax650",
+        "choices": [{
+            "index": 0,
+            "delta": delta,
+            "finish_reason": finish_reason
+        }]
+    }
+    return b"data: " + orjson.dumps(chunk) + b"\n\n"
+
+def generated_text(data):
+    """Return the generated text from a Flask /api/generate response body"""
+    # Flask server should return {"response": "generated text"}
+    text = data.get("response", "")
+    if not text:
+        print(f"⚠️  No 'response' field in data: {data}")
+        # Try alternative field names
+        text = data.get("text", data.get("content", ""))
+    return text
+
+async def stream_completion(formatted_prompt):
+    """Relay the /api/generate result to the client as SSE chunks"""
+    request_id = f"chatcmpl-{int(time.time())}"
+    created = int(time.time())
+
+    # The role chunk goes out straight away. The Flask server only returns a
+    # complete JSON body, so there is nothing to relay incrementally or to
+    # strip think tags from across chunk boundaries: one non-streaming POST,
+    # then its whole text as a single content delta
+    yield sse_format(request_id, created, {"role": "assistant"})
+    try:
+        response = await client.post(
+            f"{LLM_ORIGIN}/api/generate",
+            json={
+                "prompt": formatted_prompt,
+                "stream": False
+            },
+            timeout=300.0  # 5 minutes for TPU processing
+        )
+        if response.status_code != 200:
+            print(f"❌ Flask server error: {response.status_code}")
+            yield sse_format(request_id, created, {}, "error")
+            yield b"data: [DONE]\n\n"
+            return
+
+        text = clean_response(generated_text(orjson.loads(response.content)))
+        if text:
+            yield sse_format(request_id, created, {"content": text})
+        yield sse_format(request_id, created, {}, "stop")
+    except httpx.TimeoutException:
+        print("❌ Timeout waiting for TPU response")
+        yield sse_format(request_id, created, {}, "error")
+    except Exception as e:
+        print(f"❌ Error: {type(e).__name__}: {e}")
+        yield sse_format(request_id, created, {}, "error")
+    yield b"data: [DONE]\n\n"
+
+# Last upstream health probe, refreshed in the background so orchestrator
+# probes don't add load to the Flask server during inference
+HEALTH_INTERVAL = 1.0
+_health_cache = {"result": {"status": "unknown", "flask_server": "unknown"}}
+
+async def refresh_health():
+    """Probe the Flask server and update the cached health status"""
+    try:
+        # Check if Flask server is responding
+        await client.get(f"{LLM_ORIGIN}/health", timeout=5.0)
+        result = {"status": "healthy", "flask_server": "connected"}
+    except httpx.HTTPError:
+        result = {"status": "degraded", "flask_server": "disconnected"}
+    _health_cache["result"] = result
+
+async def refresh_health_loop():
+    while True:
+        # One failed probe must not end the task, or /health would serve the
+        # last cached result forever
+        try:
+            await refresh_health()
+        except Exception as e:
+            print(f"❌ Health refresh failed: {type(e).__name__}: {e}")
+        await asyncio.sleep(HEALTH_INTERVAL)
+
+@app.on_event("startup")
+async def start_health_refresh():
+    """Start the background health refresher"""
+    app.state.health_task = asyncio.create_task(refresh_health_loop())
+
+@app.on_event("shutdown")
+async def close_client():
+    """Close pooled connections on shutdown"""
+    app.state.health_task.cancel()
+    await client.aclose()
 
 @app.post("/v1/chat/completions")
 async def openai_chat_completions(request: Request):
     """OpenAI-compatible chat completions endpoint"""
-    body = await request.json()
+    body = orjson.loads(await request.body())
     messages = body.get("messages", [])
     stream = body.get("stream", False)
     
+    # Drop empty messages, failed KV-cache notices and unknown roles up front
+    prompt_messages = [
+        msg for msg in messages
+        if msg["role"] in ROLE_PREFIX
+        and msg["content"].strip()
+        and "SetKVCache failed" not in msg["content"]
+    ]
+
     # Format messages into a single prompt
-    formatted_prompt = ""
-    for msg in messages:
-        role = msg["role"]
-        content = msg["content"]
-        
-        if "SetKVCache failed" in content or not content.strip():
-            continue
-            
-        if role == "system":
-            formatted_prompt += f"Instructions: {content}\n"
-        elif role == "user":
-            formatted_prompt += f"User: {content}\n"
-        elif role == "assistant":
-            formatted_prompt += f"Assistant: {content}\n"
-    
-    formatted_prompt += "Assistant:"
+    formatted_prompt = "".join([
+        f"{ROLE_PREFIX[msg['role']]}{msg['content']}\n"
+        for msg in prompt_messages
+    ]) + "Assistant:"
 
     print("\n" + "📡" + "-"*50)
     print(f"FORWARDING {len(messages)} MESSAGES TO TPU")
@@ -52,6 +200,15 @@ async def openai_chat_completions(request: Request):
     print(formatted_prompt)
     print("-" * 52 + "\n")
 
+    if stream:
+        # SSEPassthroughGZipMiddleware leaves text/event-stream uncompressed,
+        # so each event reaches the client as soon as it is yielded
+        return StreamingResponse(
+            stream_completion(formatted_prompt),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+
     try:
         # Call the Flask server's /api/generate endpoint
         # This endpoint returns a complete response, not streaming
@@ -67,32 +224,30 @@ async def openai_chat_completions(request: Request):
         if response.status_code != 200:
             print(f"❌ Flask server error: {response.status_code}")
             print(f"Response: {response.text}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"error": f"LLM server error: {response.status_code}"}
             )
         
         # Parse the Flask server response
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"📦 Received response from Flask server")
         print(f"Response keys: {list(data.keys())}")
         
         # Extract the generated text
-        # Flask server should return {"response": "generated text"}
-        generated_text = data.get("response", "")
-        
-        if not generated_text:
-            print(f"⚠️  No 'response' field in data: {data}")
-            # Try alternative field names
-            generated_text = data.get("text", data.get("content", ""))
+        text = generated_text(data)
         
-        print(f"✅ Generated text: {len(generated_text)} chars")
-        if generated_text:
-            print(f"Preview: {generated_text[:200]}...")
+        print(f"✅ Generated text: {len(text)} chars")
+        if text:
+            print(f"Preview: {text[:200]}...")
         
         # Clean the response
-        cleaned_text = clean_response(generated_text)
+        cleaned_text = clean_response(text)
         
+        # Approximate token counts (~4 chars per token)
+        prompt_tokens = max(1, len(formatted_prompt) // 4)
+        completion_tokens = max(1, len(cleaned_text) // 4)
+
         # Return in OpenAI format
         request_id = f"chatcmpl-{int(time.time())}"
         return {
@@ -109,21 +264,21 @@ async def openai_chat_completions(request: Request):
                 "finish_reason": "stop"
             }],
             "usage": {
-                "prompt_tokens": len(formatted_prompt.split()),
-                "completion_tokens": len(cleaned_text.split()),
-                "total_tokens": len(formatted_prompt.split()) + len(cleaned_text.split())
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
             }
         }
         
     except httpx.TimeoutException:
         print("❌ Timeout waiting for TPU response")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=504,
             content={"error": "TPU processing timeout (5 minutes)"}
         )
     except Exception as e:
         print(f"❌ Error: {type(e).__name__}: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": str(e)}
         )
@@ -144,12 +299,9 @@ async def list_models():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    try:
-        # Check if Flask server is responding
-        response = await client.get(f"{LLM_ORIGIN}/health", timeout=5.0)
-        return {"status": "healthy", "flask_server": "connected"}
-    except:
-        return {"status": "degraded", "flask_server": "disconnected"}
+    # Always served from the cache; only refresh_health_loop probes Flask,
+    # so a slow upstream never blocks this endpoint
+    return _health_cache["result"]
 
 if __name__ == "__main__":
     import uvicorn
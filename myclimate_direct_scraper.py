@@ -4,17 +4,40 @@ Direct MyClimate Flight Calculator Scraper
 Bypasses LLM complexity with smart element discovery
 """
 import asyncio
-from playwright.async_api import async_playwright
+import re
+from playwright.async_api import async_playwright, Error as PWError
 
-async def scrape_myclimate():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+from scraper_patterns import SITE_SELECTORS, block_unneeded_requests
+
+# Departure airport input of the calculator form
+FROM_FIELD_SELECTOR = SITE_SELECTORS['co2.myclimate.org']['from'][0]
+
+# Distance (km) and emissions (kg/t) values, matched in a single scan
+_RESULT_RE = re.compile(r'(?P<num>\d+[\d\.]*)\s*(?P<unit>km|(?:kg|t)\b)', re.IGNORECASE)
+
+async def open_browser():
+    """Start Playwright and a long-lived browser context for repeated scrapes"""
+    p = await async_playwright().start()
+    browser = await p.chromium.launch(headless=True)
+    ctx = await browser.new_context()
+    return p, browser, ctx
+
+async def scrape_myclimate(ctx):
+    page = await ctx.new_page()
+    # Everything after new_page() runs under the finally, so a failed goto or
+    # wait can't leak a page on the shared context
+    try:
+        await page.route("**/*", block_unneeded_requests)
         
         # Navigate to page
         print("📍 Navigating to MyClimate...")
         await page.goto('https://co2.myclimate.org/en/flight_calculators/new', wait_until='networkidle')
-        await page.wait_for_timeout(2000)
+        # Wait on the calculator's own field; the first <input> on the page is
+        # the often-hidden site search box
+        try:
+            await page.locator(FROM_FIELD_SELECTOR).wait_for(state="attached", timeout=5000)
+        except PWError:
+            print("⚠️  Calculator form not found, trying anyway...")
         
         # Strategies for element discovery - try multiple patterns
         async def fill_field_smart(field_name, value):
@@ -27,17 +50,23 @@ async def scrape_myclimate():
                 f'input',  # Last resort: try first input
             ]
             
-            for selector in selectors:
+            async def probe(element):
                 try:
-                    element = page.locator(selector).first
-                    visible = await element.is_visible(timeout=1000)
-                    if visible:
-                        print(f"✅ Found {field_name} with: {selector}")
-                        await element.fill(value)
-                        await page.wait_for_timeout(1000)
-                        return True
-                except:
-                    pass
+                    # count() returns 0 immediately for selectors with no match
+                    if await element.count() == 0:
+                        return False
+                    return await element.is_visible(timeout=200)
+                except PWError:
+                    return False
+
+            # Probe all selectors at once, then fill in priority order
+            locators = [page.locator(selector).first for selector in selectors]
+            results = await asyncio.gather(*(probe(element) for element in locators))
+            for selector, element, visible in zip(selectors, locators, results):
+                if visible:
+                    print(f"✅ Found {field_name} with: {selector}")
+                    await element.fill(value)
+                    return True
             return False
         
         # Try filling From airport
@@ -45,34 +74,35 @@ async def scrape_myclimate():
         if await fill_field_smart("From", "CDG"):
             # Wait for dropdown and click first option
             try:
-                await page.wait_for_selector("li", timeout=2000)
                 first_option = page.locator("li").first
+                await first_option.wait_for(state="visible", timeout=3000)
                 await first_option.click()
-                await page.wait_for_timeout(500)
-            except:
+                await first_option.wait_for(state="hidden", timeout=2000)
+            except PWError:
                 print("⚠️  No dropdown found, continuing...")
         
         # Fill To airport
         if await fill_field_smart("To", "LHR"):
             try:
-                await page.wait_for_selector("li", timeout=2000)
                 first_option = page.locator("li").first
+                await first_option.wait_for(state="visible", timeout=3000)
                 await first_option.click()
-                await page.wait_for_timeout(500)
-            except:
+                await first_option.wait_for(state="hidden", timeout=2000)
+            except PWError:
                 pass
         
         # Try to select aircraft and passengers via any available method
         print("🎯 Selecting form options...")
         try:
-            # Try selectOption for any select elements
+            # Try selectOption for any select elements, using the handles directly
             selects = await page.query_selector_all("select")
-            for i, select in enumerate(selects):
-                if i == 0:
-                    await page.select_option(f"select:nth-of-type({i+1})", "BOEING_737") if await page.query_selector(f"select:nth-of-type({i+1})") else None
-                elif i == 1:
-                    await page.select_option(f"select:nth-of-type({i+1})", "1") if await page.query_selector(f"select:nth-of-type({i+1})") else None
-        except Exception as e:
+            values = ["BOEING_737", "1"]
+            for select, value in zip(selects, values):
+                try:
+                    await select.select_option(value)
+                except PWError as e:
+                    print(f"⚠️  Form selection: {e}")
+        except PWError as e:
             print(f"⚠️  Form selection: {e}")
         
         # Click Calculate button - try multiple patterns
@@ -84,31 +114,42 @@ async def scrape_myclimate():
             'button:visible',
         ]
         
+        clicked = False
         for selector in button_selectors:
             try:
                 btn = page.locator(selector).first
                 if await btn.is_visible(timeout=500):
                     await btn.click()
                     print(f"✅ Clicked button: {selector}")
-                    await page.wait_for_timeout(3000)
+                    clicked = True
                     break
-            except:
+            except PWError:
                 pass
         
+        # Outside the loop, so a slow page after submit can't trigger a click
+        # on the next candidate button
+        if clicked:
+            try:
+                await page.wait_for_load_state("networkidle", timeout=10000)
+            except PWError:
+                print("⚠️  Page still busy after submit, reading results anyway...")
+        
         # Extract results - multiple strategies
         print("📊 Extracting results...")
         try:
             # Get page content and search for result patterns
             content = await page.content()
             
-            # Try to find distance
-            import re
-            distance_match = re.search(r'(\d+[\d\.]*)\s*km', content, re.IGNORECASE)
-            distance = distance_match.group(1) + " km" if distance_match else "Not found"
-            
-            # Try to find emissions
-            emissions_match = re.search(r'(\d+[\d\.]*)\s*(?:kg|t)\b', content, re.IGNORECASE)
-            emissions = emissions_match.group(1) + " kg/t" if emissions_match else "Not found"
+            # Find the first distance and emissions values in one pass
+            distance = emissions = "Not found"
+            for match in _RESULT_RE.finditer(content):
+                if match.group('unit').lower() == 'km':
+                    if distance == "Not found":
+                        distance = match.group('num') + " km"
+                elif emissions == "Not found":
+                    emissions = match.group('num') + " kg/t"
+                if distance != "Not found" and emissions != "Not found":
+                    break
             
             print(f"📈 Distance: {distance}")
             print(f"📈 Emissions: {emissions}")
@@ -116,10 +157,18 @@ async def scrape_myclimate():
             return {"distance": distance, "emissions": emissions}
         except Exception as e:
             print(f"❌ Extraction failed: {e}")
-        
-        finally:
-            await browser.close()
+    finally:
+        await page.close()
+
+async def main():
+    p, browser, ctx = await open_browser()
+    try:
+        return await scrape_myclimate(ctx)
+    finally:
+        await ctx.close()
+        await browser.close()
+        await p.stop()
 
 if __name__ == "__main__":
-    result = asyncio.run(scrape_myclimate())
+    result = asyncio.run(main())
     print(f"\n✅ Final Result: {result}")
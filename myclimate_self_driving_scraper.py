@@ -9,12 +9,126 @@ Fully automated end-to-end solution with:
 """
 
 import asyncio
-import re
+import os
 import json
+import logging
 import sys
-from playwright.async_api import async_playwright
+from pathlib import Path
+from urllib.parse import urlparse
 
-async def scrape_flight(departure='CDG', arrival='LHR', passengers=1, aircraft='ECONOMY', headless=False):
+from scraper_patterns import DISTANCE_PATTERNS, EMISSIONS_PATTERNS, SITE_SELECTORS, block_unneeded_requests
+
+log = logging.getLogger(__name__)
+
+# Playwright is imported inside the functions that drive a browser, so the
+# patterns and helpers here can be imported without paying its import cost
+
+CALCULATOR_URL = 'https://co2.myclimate.org/en/flight_calculators/new'
+
+# Last known good selectors per site host: {host: {'from': ..., 'to': ..., 'submit': ...}}
+_SELECTOR_CACHE_PATH = Path('~/.myclimate_selectors.json').expanduser()
+
+_SITE = SITE_SELECTORS['co2.myclimate.org']
+AUTOCOMPLETE_SELECTOR = _SITE['autocomplete']
+RESULT_SELECTOR = _SITE['result']
+RESULT_CONTAINER_SELECTOR = _SITE['result_container']
+FROM_STRATEGIES = _SITE['from']
+TO_STRATEGIES = _SITE['to']
+SUBMIT_STRATEGIES = _SITE['submit']
+
+# Wait budgets in milliseconds; override per call with timeouts= or mode=
+DEFAULT_TIMEOUTS = {
+    'navigation': 15000,     # page.goto until DOMContentLoaded
+    'page_load': 10000,      # departure input appearing after load
+    'selector_probe': 1000,  # is_visible probe for Playwright-only selectors
+    'option_probe': 500,     # is_visible probe for optional form fields
+    'consent': 3000,         # consent dialog closing after the click
+    'dropdown': 2000,        # autocomplete suggestions appearing
+    'dropdown_close': 3000,  # autocomplete suggestions closing after Enter
+    'submit': 10000,         # results appearing after submit
+    'submit_retry': 2000,    # one extra wait if results are late
+}
+TIMEOUT_PRESETS = {
+    # Interactive callers: fail fast
+    'live': {'navigation': 10000, 'page_load': 5000, 'selector_probe': 300, 'option_probe': 200, 'dropdown': 500,
+             'dropdown_close': 1500, 'submit': 5000, 'submit_retry': 1000},
+    # Batch jobs: favour success on slow sites
+    'background': {'navigation': 30000, 'page_load': 20000, 'selector_probe': 2000, 'option_probe': 1000, 'dropdown': 4000,
+                   'dropdown_close': 6000, 'submit': 30000, 'submit_retry': 5000},
+}
+
+def load_selector_cache():
+    try:
+        with open(_SELECTOR_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_selector_cache(cache):
+    """Write the selector cache atomically so concurrent runs never see a partial file."""
+    tmp_path = _SELECTOR_CACHE_PATH.with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, _SELECTOR_CACHE_PATH)
+    except OSError as e:
+        log.warning(f"      ℹ️  Could not save selector cache: {e}")
+
+_selector_cache = load_selector_cache()
+
+def resolve_timeouts(timeouts=None, mode=None):
+    """Merge the defaults, an optional mode preset and explicit overrides."""
+    resolved = dict(DEFAULT_TIMEOUTS)
+    if mode:
+        resolved.update(TIMEOUT_PRESETS[mode])
+    if timeouts:
+        resolved.update(timeouts)
+    return resolved
+
+async def wait_for_state(locator, state, timeout):
+    """Wait for a locator state, returning False instead of raising on timeout."""
+    from playwright.async_api import TimeoutError as PWTimeout
+    try:
+        await locator.wait_for(state=state, timeout=timeout)
+        return True
+    except PWTimeout:
+        return False
+
+# Visibility of each selector's first match in one round-trip: true/false,
+# or null when the selector is Playwright-only syntax (e.g. :has-text)
+_VISIBILITY_JS = """
+sels => sels.map(s => {
+    let el;
+    try { el = document.querySelector(s); } catch (e) { return null; }
+    if (!el) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && el.getClientRects().length > 0;
+})
+"""
+
+async def find_first_visible(page, selectors, cached=None, probe_timeout=1000):
+    """Return (locator, selector) for the first visible selector, or (None, None).
+
+    A cached selector from a previous run is tried first. CSS selectors are
+    checked together in a single page.evaluate; Playwright-only selectors
+    fall back to a per-selector is_visible probe.
+    """
+    from playwright.async_api import Error as PWError
+    candidates = [cached] + [s for s in selectors if s != cached] if cached else list(selectors)
+    visible = await page.evaluate(_VISIBILITY_JS, candidates)
+    for selector, is_visible in zip(candidates, visible):
+        locator = page.locator(selector).first
+        if is_visible is None:
+            try:
+                is_visible = await locator.is_visible(timeout=probe_timeout)
+            except PWError:
+                is_visible = False
+        if is_visible:
+            return locator, selector
+    return None, None
+
+async def scrape_flight(departure='CDG', arrival='LHR', passengers=1, aircraft='ECONOMY', headless=False, context=None,
+                        timeouts=None, mode=None):
     """
     Self-driving scraper for MyClimate flight calculator.
     
@@ -24,231 +138,283 @@ async def scrape_flight(departure='CDG', arrival='LHR', passengers=1, aircraft='
         passengers: Number of passengers (default 1)
         aircraft: Cabin class (default 'ECONOMY')
         headless: Run browser headless (default False for debugging)
+        context: Existing browser context to open the page in; when None a
+            browser is launched and closed for this call only
+        timeouts: Dict overriding entries of DEFAULT_TIMEOUTS (milliseconds)
+        mode: Optional TIMEOUT_PRESETS name, 'live' or 'background'
     
     Returns:
         dict: Results with 'status', 'distance_km', 'emissions_kg_co2'
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        page = await browser.new_page()
+    from playwright.async_api import async_playwright
+    if context is None:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            try:
+                context = await browser.new_context()
+                return await scrape_flight(departure, arrival, passengers, aircraft, headless, context,
+                                           timeouts, mode)
+            finally:
+                await browser.close()
+
+    page = await context.new_page()
+    try:
+        return await _scrape_on_page(page, departure, arrival, passengers, aircraft,
+                                     resolve_timeouts(timeouts, mode))
+    finally:
+        await page.close()
+
+async def _scrape_on_page(page, departure, arrival, passengers, aircraft, timeouts):
+    """Run the scrape steps for one route on an already open page."""
+    from playwright.async_api import Error as PWError
+    await page.route('**/*', block_unneeded_requests)
+    
+    try:
+        log.info(
+            f"\n{'='*70}\n"
+            f"🚀  MYCLIMATE SELF-DRIVING FLIGHT CALCULATOR\n"
+            f"{'='*70}\n"
+            f"📍 Route: {departure} → {arrival}\n"
+            f"👥 Passengers: {passengers} | ✈️  Cabin: {aircraft}"
+        )
+        
+        # STEP 1: Load page
+        log.debug(f"\n[1/8] 📄 Loading calculator page...")
+        # Trackers can hold networkidle open; the form is usable once its inputs exist
+        response = await page.goto(CALCULATOR_URL, wait_until='domcontentloaded', timeout=timeouts['navigation'])
+        if response and response.status >= 400:
+            log.error(f"      ❌ ERROR: Calculator page returned HTTP {response.status}")
+            return {'status': 'error', 'error': f'http_{response.status}'}
+        form_input = page.locator(', '.join(FROM_STRATEGIES[:2])).first
+        if not await wait_for_state(form_input, 'attached', timeouts['page_load']):
+            log.warning(f"      ⚠️  Departure input not found yet, continuing")
+        log.debug(f"      ✅ Page loaded")
         
+        # STEP 2: Dismiss consent dialog
+        log.debug(f"\n[2/8] 🔐 Checking for consent dialog...")
         try:
-            print(f"\n{'='*70}")
-            print(f"🚀  MYCLIMATE SELF-DRIVING FLIGHT CALCULATOR")
-            print(f"{'='*70}")
-            print(f"📍 Route: {departure} → {arrival}")
-            print(f"👥 Passengers: {passengers} | ✈️  Cabin: {aircraft}")
-            
-            # STEP 1: Load page
-            print(f"\n[1/8] 📄 Loading calculator page...")
-            await page.goto('https://co2.myclimate.org/en/flight_calculators/new', wait_until='networkidle')
-            await page.wait_for_timeout(2000)
-            print(f"      ✅ Page loaded")
-            
-            # STEP 2: Dismiss consent dialog
-            print(f"\n[2/8] 🔐 Checking for consent dialog...")
-            try:
-                accept_btn = page.locator('button:has-text("Accept"), button[aria-label*="Close"]').first
-                if await accept_btn.is_visible(timeout=2000):
-                    await accept_btn.click()
-                    print(f"      ✅ Dismissed consent dialog")
-                    await page.wait_for_timeout(1000)
-                else:
-                    print(f"      ℹ️  No visible consent dialog")
-            except Exception as e:
-                print(f"      ℹ️  Could not dismiss dialog: {type(e).__name__}")
-            
-            # STEP 3: Find and fill FROM airport
-            print(f"\n[3/8] 🛫 Filling departure airport: {departure}")
-            from_strategies = [
-                'input[id="flight_calculator_from"]',
-                'input[name="flight_calculator[from]"]',
-                'input[type="text"]:nth-of-type(2)',  # Skip search input at #0
-            ]
-            
-            from_input = None
-            for selector in from_strategies:
-                try:
-                    locator = page.locator(selector).first
-                    if await locator.is_visible(timeout=1000):
-                        from_input = locator
-                        print(f"      ✅ Found with selector: {selector}")
-                        break
-                except:
-                    pass
-            
-            if not from_input:
-                print(f"      ❌ ERROR: Could not find 'from' input field")
-                return {'status': 'error', 'error': 'from_input_not_found'}
-            
-            await from_input.fill(departure)
-            await page.wait_for_timeout(500)
-            print(f"      → Filled: {departure}")
-            
-            # Use keyboard to select from dropdown
-            await from_input.press('ArrowDown')  # Open dropdown
-            await page.wait_for_timeout(300)
-            await from_input.press('Enter')  # Select first option
-            print(f"      ✅ Selected first option")
-            await page.wait_for_timeout(1500)
-            
-            # STEP 4: Find and fill TO airport
-            print(f"\n[4/8] 🛬 Filling arrival airport: {arrival}")
-            to_strategies = [
-                'input[id="flight_calculator_to"]',
-                'input[name="flight_calculator[to]"]',
-                'input[type="text"]:nth-of-type(4)',  # Skip search and from inputs
+            accept_btns = page.locator('button:has-text("Accept"), button[aria-label*="Close"]')
+            accept_btn = accept_btns.first
+            # count() returns at once when there is no dialog at all
+            if await accept_btns.count() > 0 and await accept_btn.is_visible(timeout=200):
+                await accept_btn.click()
+                log.debug(f"      ✅ Dismissed consent dialog")
+                await wait_for_state(accept_btn, 'hidden', timeouts['consent'])
+            else:
+                log.debug(f"      ℹ️  No visible consent dialog")
+        except PWError as e:
+            log.debug(f"      ℹ️  Could not dismiss dialog: {type(e).__name__}")
+        
+        # STEP 3: Find and fill FROM airport
+        log.debug(f"\n[3/8] 🛫 Filling departure airport: {departure}")
+        host = urlparse(CALCULATOR_URL).netloc
+        site_selectors = _selector_cache.get(host, {})
+        found_selectors = {}
+
+        # Both inputs exist on load, so discover them together
+        (from_input, from_selector), (to_input, to_selector) = await asyncio.gather(
+            find_first_visible(page, FROM_STRATEGIES, site_selectors.get('from'), timeouts['selector_probe']),
+            find_first_visible(page, TO_STRATEGIES, site_selectors.get('to'), timeouts['selector_probe']),
+        )
+        found_selectors['from'] = from_selector
+        found_selectors['to'] = to_selector
+        
+        if from_input:
+            log.debug(f"      ✅ Found with selector: {from_selector}")
+        else:
+            log.error(f"      ❌ ERROR: Could not find 'from' input field")
+            return {'status': 'error', 'error': 'from_input_not_found'}
+        
+        await from_input.fill(departure)
+        log.debug(f"      → Filled: {departure}")
+        
+        # Use keyboard to select from dropdown
+        suggestions = page.locator(AUTOCOMPLETE_SELECTOR).first
+        await wait_for_state(suggestions, 'visible', timeouts['dropdown'])
+        await from_input.press('ArrowDown')  # Open dropdown
+        await from_input.press('Enter')  # Select first option
+        log.debug(f"      ✅ Selected first option")
+        await wait_for_state(suggestions, 'hidden', timeouts['dropdown_close'])
+        
+        # STEP 4: Find and fill TO airport
+        log.debug(f"\n[4/8] 🛬 Filling arrival airport: {arrival}")
+        if to_input:
+            log.debug(f"      ✅ Found with selector: {to_selector}")
+        else:
+            log.error(f"      ❌ ERROR: Could not find 'to' input field")
+            return {'status': 'error', 'error': 'to_input_not_found'}
+        
+        await to_input.fill(arrival)
+        log.debug(f"      → Filled: {arrival}")
+        
+        # Use keyboard to select from dropdown
+        suggestions = page.locator(AUTOCOMPLETE_SELECTOR).first
+        await wait_for_state(suggestions, 'visible', timeouts['dropdown'])
+        await to_input.press('ArrowDown')  # Open dropdown
+        await to_input.press('Enter')  # Select first option
+        log.debug(f"      ✅ Selected first option")
+        await wait_for_state(suggestions, 'hidden', timeouts['dropdown_close'])
+        
+        # STEP 5: Set passengers and aircraft (if applicable)
+        log.debug(f"\n[5/8] ⚙️  Configuring form parameters...")
+        try:
+            # Try to find and set passenger count
+            passenger_selector_strategies = [
+                'select[name*="passenger"]',
+                'input[name*="passenger"]',
+                'select[id*="passenger"]',
             ]
-            
-            to_input = None
-            for selector in to_strategies:
+            for selector in passenger_selector_strategies:
                 try:
-                    locator = page.locator(selector).first
-                    if await locator.is_visible(timeout=1000):
-                        to_input = locator
-                        print(f"      ✅ Found with selector: {selector}")
+                    elem = page.locator(selector).first
+                    if await elem.is_visible(timeout=timeouts['option_probe']):
+                        await elem.select_option(str(passengers))
+                        log.debug(f"      ✅ Set passengers: {passengers}")
                         break
-                except:
+                except PWError:
                     pass
             
-            if not to_input:
-                print(f"      ❌ ERROR: Could not find 'to' input field")
-                return {'status': 'error', 'error': 'to_input_not_found'}
-            
-            await to_input.fill(arrival)
-            await page.wait_for_timeout(500)
-            print(f"      → Filled: {arrival}")
-            
-            # Use keyboard to select from dropdown
-            await to_input.press('ArrowDown')  # Open dropdown
-            await page.wait_for_timeout(300)
-            await to_input.press('Enter')  # Select first option
-            print(f"      ✅ Selected first option")
-            await page.wait_for_timeout(1500)
-            
-            # STEP 5: Set passengers and aircraft (if applicable)
-            print(f"\n[5/8] ⚙️  Configuring form parameters...")
+            log.debug(f"      ✅ Form parameters configured")
+        except Exception as e:
+            log.debug(f"      ℹ️  Could not set all parameters: {type(e).__name__}")
+        
+        # STEP 6: Submit form
+        log.debug(f"\n[6/8] 📤 Submitting form...")
+        submit_found = False
+        
+        # Try multiple submit strategies
+        btn, submit_selector = await find_first_visible(
+            page, [selector for selector, _ in SUBMIT_STRATEGIES], site_selectors.get('submit'),
+            timeouts['selector_probe']
+        )
+        if btn:
             try:
-                # Try to find and set passenger count
-                passenger_selector_strategies = [
-                    'select[name*="passenger"]',
-                    'input[name*="passenger"]',
-                    'select[id*="passenger"]',
-                ]
-                for selector in passenger_selector_strategies:
-                    try:
-                        elem = page.locator(selector).first
-                        if await elem.is_visible(timeout=500):
-                            await elem.select_option(str(passengers))
-                            print(f"      ✅ Set passengers: {passengers}")
-                            break
-                    except:
-                        pass
-                
-                print(f"      ✅ Form parameters configured")
-            except Exception as e:
-                print(f"      ℹ️  Could not set all parameters: {type(e).__name__}")
-            
-            # STEP 6: Submit form
-            print(f"\n[6/8] 📤 Submitting form...")
-            submit_found = False
-            
-            # Try multiple submit strategies
-            submit_strategies = [
-                ('button[type="submit"]', 'submit button'),
-                ('button:has-text("Calculate")', 'Calculate button'),
-                ('button:has-text("Submit")', 'Submit button'),
-                ('button', 'any button'),
-            ]
-            
-            for selector, desc in submit_strategies:
-                try:
-                    btn = page.locator(selector).first
-                    if await btn.is_visible(timeout=1000):
-                        await btn.click()
-                        print(f"      ✅ Clicked {desc}")
-                        submit_found = True
-                        break
-                except:
-                    pass
-            
-            if not submit_found:
-                print(f"      ⚠️  Could not find submit button, trying keyboard Enter on form...")
-                # Focus on the to_input and press Enter
-                await to_input.press('Enter')
-            
-            await page.wait_for_timeout(3000)
-            print(f"      ✅ Form submitted, waiting for results...")
-            
-            # STEP 7: Extract results from page
-            print(f"\n[7/8] 📊 Extracting results...")
+                await btn.click()
+                log.debug(f"      ✅ Clicked {dict(SUBMIT_STRATEGIES).get(submit_selector, submit_selector)}")
+                submit_found = True
+                found_selectors['submit'] = submit_selector
+            except PWError:
+                pass
+        
+        if not submit_found:
+            log.warning(f"      ⚠️  Could not find submit button, trying keyboard Enter on form...")
+            # Focus on the to_input and press Enter
+            await to_input.press('Enter')
+        
+        log.debug(f"      ✅ Form submitted, waiting for results...")
+        result_marker = page.locator(RESULT_SELECTOR).first
+        if not await wait_for_state(result_marker, 'visible', timeouts['submit']):
+            # One short retry before extracting whatever is there
+            if not await wait_for_state(result_marker, 'visible', timeouts['submit_retry']):
+                log.warning(f"      ⚠️  Results did not appear, extracting anyway")
+                found_selectors = None
+
+        # Remember winning selectors; forget them if the run went wrong
+        if found_selectors is None:
+            if _selector_cache.pop(host, None) is not None:
+                save_selector_cache(_selector_cache)
+        elif found_selectors != site_selectors:
+            _selector_cache[host] = found_selectors
+            save_selector_cache(_selector_cache)
+        
+        # STEP 7: Extract results from page
+        log.debug(f"\n[7/8] 📊 Extracting results...")
+        # Scan only the result panel; fall back to the whole page if it's missing
+        result_panel = page.locator(RESULT_CONTAINER_SELECTOR).first
+        if await result_panel.count():
+            content = await result_panel.inner_text()
+        else:
             content = await page.content()
-            
-            distance = None
-            distance_patterns = [
-                (r'Distance[:\s]*(\d+[\d\.]*)\s*(?:km|km\.)', 'pattern 1'),
-                (r'(\d+[\d\.]*)\s*km', 'pattern 2'),
-                (r'distance[^0-9]*(\d+[\d\.]*)', 'pattern 3'),
-            ]
-            
-            for pattern, desc in distance_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    distance = match.group(1)
-                    print(f"      ✅ Found distance ({desc}): {distance} km")
-                    break
-            
-            if not distance:
-                print(f"      ⚠️  Could not extract distance")
-            
-            emissions = None
-            emissions_patterns = [
-                (r'CO₂\s*amount[:\s]*(\d+[\d\.]*)\s*t', 'CO2 amount pattern'),
-                (r'(\d+[\d\.]*)\s*t\s*CO2', 'tonnes pattern'),
-                (r'(\d+[\d\.]*)\s*kg\s*CO2', 'kg pattern'),
-                (r'CO2[:\s]*(\d+[\d\.]*)', 'CO2 direct pattern'),
-            ]
-            
-            for pattern, desc in emissions_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    emissions = match.group(1)
-                    unit = re.search(r'(?:kg|t|tonnes?)', pattern)
-                    print(f"      ✅ Found emissions ({desc}): {emissions} t CO2")
-                    break
-            
-            if not emissions:
-                print(f"      ⚠️  Could not extract emissions")
-            
-            # STEP 8: Prepare result
-            print(f"\n[8/8] 🎯 Finalizing result...")
-            result = {
-                'status': 'success',
-                'from': departure,
-                'to': arrival,
-                'passengers': passengers,
-                'cabin_class': aircraft,
-                'distance_km': distance or 'Not extracted',
-                'emissions_kg_co2': emissions or 'Not extracted',
-            }
-            
-            print(f"\n{'='*70}")
-            print(f"✅ RESULT:")
-            print(f"   Distance: {result['distance_km']} km")
-            print(f"   Emissions: {result['emissions_kg_co2']} kg CO2")
-            print(f"{'='*70}")
-            
-            return result
         
-        except Exception as e:
-            print(f"\n❌ ERROR: {type(e).__name__}: {str(e)[:100]}")
-            import traceback
-            traceback.print_exc()
-            return {
-                'status': 'error',
-                'error': str(e),
-            }
+        distance = None
+        for pattern, desc in DISTANCE_PATTERNS:
+            match = pattern.search(content)
+            if match:
+                distance = match.group(1)
+                log.debug(f"      ✅ Found distance ({desc}): {distance} km")
+                break
+        
+        if not distance:
+            log.warning(f"      ⚠️  Could not extract distance")
         
+        emissions = None
+        for pattern, desc in EMISSIONS_PATTERNS:
+            match = pattern.search(content)
+            if match:
+                emissions = match.group(1)
+                log.debug(f"      ✅ Found emissions ({desc}): {emissions} t CO2")
+                break
+        
+        if not emissions:
+            log.warning(f"      ⚠️  Could not extract emissions")
+        
+        # STEP 8: Prepare result
+        log.debug(f"\n[8/8] 🎯 Finalizing result...")
+        result = {
+            'status': 'success',
+            'from': departure,
+            'to': arrival,
+            'passengers': passengers,
+            'cabin_class': aircraft,
+            'distance_km': distance or 'Not extracted',
+            'emissions_kg_co2': emissions or 'Not extracted',
+        }
+        
+        log.info(
+            f"\n{'='*70}\n"
+            f"✅ RESULT:\n"
+            f"   Distance: {result['distance_km']} km\n"
+            f"   Emissions: {result['emissions_kg_co2']} kg CO2\n"
+            f"{'='*70}"
+        )
+        
+        return result
+    
+    except Exception as e:
+        log.exception(f"\n❌ ERROR: {type(e).__name__}: {str(e)[:100]}")
+        return {
+            'status': 'error',
+            'error': str(e),
+        }
+
+async def scrape_many(routes, max_concurrency=5, headless=True):
+    """
+    Scrape several routes with one shared browser and context.
+    
+    Args:
+        routes: Iterable of dicts of scrape_flight keyword arguments,
+            e.g. {'departure': 'CDG', 'arrival': 'LHR'}
+        max_concurrency: Maximum number of pages scraping at once
+        headless: Run browser headless
+    
+    Returns:
+        list: One scrape_flight result dict per route, in order
+    """
+    from playwright.async_api import async_playwright
+    sem = asyncio.Semaphore(max_concurrency)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            context = await browser.new_context()
+
+            async def one(index, route):
+                # Every route hits the same host, so stagger start-up by 100ms
+                await asyncio.sleep(0.1 * index)
+                async with sem:
+                    page = await context.new_page()
+                    try:
+                        return await _scrape_on_page(
+                            page,
+                            route.get('departure', 'CDG'),
+                            route.get('arrival', 'LHR'),
+                            route.get('passengers', 1),
+                            route.get('aircraft', 'ECONOMY'),
+                            resolve_timeouts(route.get('timeouts'), route.get('mode')),
+                        )
+                    finally:
+                        await page.close()
+
+            return await asyncio.gather(*(one(i, route) for i, route in enumerate(routes)))
         finally:
             await browser.close()
 
@@ -257,6 +423,11 @@ def main():
     departure = sys.argv[1] if len(sys.argv) > 1 else 'CDG'
     arrival = sys.argv[2] if len(sys.argv) > 2 else 'LHR'
     headless = '--headless' in sys.argv
+    # Step-by-step progress is logged at DEBUG; --verbose shows it
+    logging.basicConfig(
+        level=logging.DEBUG if '--verbose' in sys.argv else logging.INFO,
+        format='%(message)s',
+    )
     
     result = asyncio.run(scrape_flight(departure, arrival, headless=headless))
     print(f"\n📋 JSON Result:\n{json.dumps(result, indent=2)}")
@@ -0,0 +1,100 @@
+"""
+Shared result patterns, selector profiles and request filters for the CO2
+calculator scrapers. Compiled once at import so every scraper and debug script
+uses the same regexes and selector strategies.
+"""
+
+import re
+
+# Result extraction patterns, compiled once and tried in priority order
+DISTANCE_PATTERNS = [
+    (re.compile(r'Distance[:\s]*(\d+[\d\.]*)\s*(?:km|km\.)', re.IGNORECASE), 'pattern 1'),
+    (re.compile(r'(\d+[\d\.]*)\s*km', re.IGNORECASE), 'pattern 2'),
+    (re.compile(r'distance[^0-9]*(\d+[\d\.]*)', re.IGNORECASE), 'pattern 3'),
+]
+EMISSIONS_PATTERNS = [
+    (re.compile(r'CO₂\s*amount[:\s]*(\d+[\d\.]*)\s*t', re.IGNORECASE), 'CO2 amount pattern'),
+    (re.compile(r'(\d+[\d\.]*)\s*t\s*CO2', re.IGNORECASE), 'tonnes pattern'),
+    (re.compile(r'(\d+[\d\.]*)\s*kg\s*CO2', re.IGNORECASE), 'kg pattern'),
+    (re.compile(r'CO2[:\s]*(\d+[\d\.]*)', re.IGNORECASE), 'CO2 direct pattern'),
+]
+
+# Numbers followed by kg or km, matched in a single scan
+KG_KM_RE = re.compile(r'(\d+(?:[.,]\d+)?)\s*(kg|km)', re.IGNORECASE)
+
+# Per-site selector profiles, keyed by host
+SITE_SELECTORS = {
+    'co2.myclimate.org': {
+        # Airport input discovery strategies, in priority order
+        'from': [
+            'input[id="flight_calculator_from"]',
+            'input[name="flight_calculator[from]"]',
+            'input[type="text"]:nth-of-type(2)',  # Skip search input at #0
+        ],
+        'to': [
+            'input[id="flight_calculator_to"]',
+            'input[name="flight_calculator[to]"]',
+            'input[type="text"]:nth-of-type(4)',  # Skip search and from inputs
+        ],
+        'submit': [
+            ('button[type="submit"]', 'submit button'),
+            ('button:has-text("Calculate")', 'Calculate button'),
+            ('button:has-text("Submit")', 'Submit button'),
+            ('button', 'any button'),
+        ],
+        # Autocomplete dropdown shown while typing an airport code
+        'autocomplete': '.autocomplete-suggestion',
+        # Text that only appears once the calculator has rendered results
+        'result': 'text=/Distance|CO₂/i',
+        # Container holding the calculator results
+        'result_container': '[class*="result"], #results, .calculator-result',
+    },
+    'ecotree.green': {
+        'to': ['input[name="To"]'],
+        # First number followed by kg once the results have rendered
+        'result': r'text=/\d+(?:[.,]\d+)?\s*kg/i',
+        # Result cards (.card-body) show a bold value above these labels
+        'result_labels': {'co2': 'Your carbon emissions', 'distance': 'Your travelled distance'},
+    },
+}
+
+_ECOTREE_LABELS = SITE_SELECTORS['ecotree.green']['result_labels']
+# EcoTree result card DOM shape, as saved in the results-page captures
+# test/train_debug.html and test/scraper_debug.html (in the repo baseline):
+#   <div class='... card-body'><div class='fw-bold'>55 kg </div>
+#   <div class='text-center'>Your carbon emissions</div></div>
+# If the selector below stops matching, compare a fresh capture with those
+# files to see whether the site markup has changed.
+# Bold value in the EcoTree CO2 result card, present once the results have rendered
+ECOTREE_CO2_SELECTOR = f'.card-body:has-text("{_ECOTREE_LABELS["co2"]}") > .fw-bold'
+
+# EcoTree CO2 and distance read in one browser round-trip, from the result
+# cards when present and by scanning the page text otherwise.
+# Call as page.evaluate(ECOTREE_RESULTS_JS, result_labels)
+ECOTREE_RESULTS_JS = """
+(labels) => {
+    const read = (label, fallback) => {
+        const card = [...document.querySelectorAll('.card-body')]
+            .find(el => el.innerText.includes(label));
+        const value = card && card.querySelector('.fw-bold');
+        if (value) return value.innerText.trim();
+        const match = document.body.innerText.match(fallback);
+        return match && match[0];
+    };
+    return [read(labels.co2, /\\d+\\s*kg/), read(labels.distance, /\\d+\\s*km/)];
+}
+"""
+
+# Requests that don't affect the calculator forms or results. Stylesheets are
+# kept because input discovery relies on is_visible checks
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+BLOCKED_HOSTS = ('googletagmanager', 'google-analytics', 'hotjar', 'doubleclick')
+
+
+async def block_unneeded_requests(route):
+    """Playwright route handler that aborts the requests above"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
@@ -1,23 +1,38 @@
 #!/usr/bin/env python3
+import asyncio
 import sys
 import json
 import re
 import os
-import time
 
 try:
-    import requests
+    import httpx
 except ImportError:
-    print("Error: 'requests' module not found. Please run: pip install requests")
+    print("Error: 'httpx' module not found. Please run: pip install httpx")
     sys.exit(1)
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 run_codegen.py <path_to_codegen_file.ts>")
-        sys.exit(1)
+# HTTP/2 and brotli are used when their optional packages are installed;
+# httpx falls back to HTTP/1.1 (e.g. for plain http:// URLs) and gzip otherwise
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+# Using port 8085 as per service configuration
+SCRAPER_URL = "http://localhost:8085"
 
-    file_path = sys.argv[1]
-    
+# Look for await page.goto('...') or "..."
+# We only care about the URL inside the first set of quotes
+GOTO_RE = re.compile(r"await\s+page\.goto\(['\"]([^'\"]+)['\"]")
+
+def load_payload(file_path):
     if not os.path.exists(file_path):
         print(f"Error: File '{file_path}' not found.")
         sys.exit(1)
@@ -30,9 +45,7 @@ def main():
         sys.exit(1)
 
     # Extract the first URL to use as the base URL
-    # Look for await page.goto('...') or "..."
-    # We only care about the URL inside the first set of quotes
-    url_match = re.search(r"await\s+page\.goto\(['\"]([^'\"]+)['\"]", content)
+    url_match = GOTO_RE.search(content)
     url = "https://example.com" # Default fallback
     if url_match:
         url = url_match.group(1)
@@ -41,62 +54,83 @@ def main():
         print(f"No page.goto found, using default: {url}")
 
     # Payload
-    payload = {
+    return {
         "url": url,
         "typescript_config": content,
         "get_html": True
     }
 
-    # Using port 8085 as per service configuration
-    api_url = "http://localhost:8085/scrape/start"
+async def run_job(client, file_path):
+    """Submit one codegen script and wait for its job to finish. Returns True on success."""
+    payload = load_payload(file_path)
+
+    api_url = f"{SCRAPER_URL}/scrape/start"
     print(f"Submitting job to {api_url}...")
-    
+
+    response = await client.post(api_url, json=payload)
+
+    if response.status_code != 200:
+        print(f"Error submitting job: {response.status_code} - {response.text}")
+        return False
+
+    result = response.json()
+    job_id = result.get("job_id")
+
+    if not job_id:
+        print(f"Error: No job_id returned. Response: {result}")
+        return False
+
+    print(f"Job started! ID: {job_id}")
+
+    # Poll for status; the service has no event stream, so poll with backoff
+    print("Waiting for job completion...")
+    delay = 0.25  # Poll quickly at first, then back off for long jobs
+    while True:
+        status_res = await client.get(f"{SCRAPER_URL}/scrape/job", params={"job_id": job_id})
+        if status_res.status_code != 200:
+            print(f"Error checking status: {status_res.text}")
+            return False
+
+        job_status = status_res.json()
+        status = job_status.get("status")
+        print(f"[{job_id}] Status: {status}")
+
+        if status in ["completed", "failed"]:
+            print("-" * 40)
+            if status == "completed":
+                print(f"Job {job_id} Completed Successfully!")
+                # Check if there is data
+                res_data = job_status.get("result", {})
+                # Print result pretty
+                print(json.dumps(res_data, indent=2))
+                return True
+            print(f"Job {job_id} Failed.")
+            print(f"Error: {job_status.get('error')}")
+            return False
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.6, 4.0)
+
+async def run_all(file_paths):
+    # One keep-alive client shared by every submit and status poll
+    timeout = httpx.Timeout(30.0, connect=3.05)
+    headers = {"Accept-Encoding": ACCEPT_ENCODING}
+    async with httpx.AsyncClient(timeout=timeout, http2=HTTP2, headers=headers) as client:
+        return await asyncio.gather(*(run_job(client, path) for path in file_paths))
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 run_codegen.py <path_to_codegen_file.ts> [more_files.ts ...]")
+        sys.exit(1)
+
     try:
-        response = requests.post(api_url, json=payload)
-        
-        if response.status_code != 200:
-            print(f"Error submitting job: {response.status_code} - {response.text}")
-            sys.exit(1)
-            
-        result = response.json()
-        job_id = result.get("job_id")
-        
-        if not job_id:
-             print(f"Error: No job_id returned. Response: {result}")
-             sys.exit(1)
-             
-        print(f"Job started! ID: {job_id}")
-        
-        # Poll for status
-        print("Waiting for job completion...")
-        while True:
-            status_res = requests.get(f"http://localhost:8085/scrape/job?job_id={job_id}")
-            if status_res.status_code != 200:
-                print(f"Error checking status: {status_res.text}")
-                break
-                
-            job_status = status_res.json()
-            status = job_status.get("status")
-            print(f"Status: {status}")
-            
-            if status in ["completed", "failed"]:
-                print("-" * 40)
-                if status == "completed":
-                    print("Job Completed Successfully!")
-                    # Check if there is data
-                    res_data = job_status.get("result", {})
-                    # Print result pretty
-                    print(json.dumps(res_data, indent=2))
-                else:
-                    print("Job Failed.")
-                    print(f"Error: {job_status.get('error')}")
-                break
-            
-            time.sleep(1)
-            
+        results = asyncio.run(run_all(sys.argv[1:]))
     except Exception as e:
         print(f"Error executing request: {e}")
         sys.exit(1)
 
+    if not all(results):
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
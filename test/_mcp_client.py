@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for test scripts that call the HDN MCP endpoint
+One pooled keep-alive client per process, so repeated tool calls reuse
+connections instead of opening a new socket each time.
+"""
+
+import httpx
+
+HDN_URL = "http://localhost:8081"
+
+_client = None
+
+def get_client():
+    """Return the process-wide client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=HDN_URL,
+            timeout=120,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        )
+    return _client
+
+async def aclose():
+    """Close pooled connections; call once at the end of the script"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Shared Playwright browser pool for the test scripts
+Browsers are launched on demand, reused across pages, and recycled after
+MAX_USES_PER_INSTANCE pages so long runs don't accumulate leaked memory.
+
+    page, ticket = await pool.acquire_page()
+    try:
+        ...
+    finally:
+        await pool.release_page(ticket)
+"""
+
+import asyncio
+import os
+import sys
+from playwright.async_api import async_playwright, Error as PWError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_patterns import block_unneeded_requests
+
+POOL_SIZE = int(os.environ.get("PLAYWRIGHT_POOL_SIZE", "4"))
+MAX_USES_PER_INSTANCE = int(os.environ.get("PLAYWRIGHT_MAX_USES", "50"))
+
+# Set ECOTREE_DEBUG=1 to watch the browser; automated runs stay headless
+DEBUG = os.environ.get("ECOTREE_DEBUG") == "1"
+
+# Skip GPU init, sandbox helpers and background services Chromium doesn't need here
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,BackForwardCache",
+]
+LAUNCH_OPTIONS = {"headless": not DEBUG, "slow_mo": 100 if DEBUG else 0, "args": CHROMIUM_ARGS}
+
+_playwright = None
+_pool = None       # idle browsers, plus None for each free slot to launch into
+_launched = 0      # slots owned by the pool (idle, in use or free)
+_uses = {}         # pages served per browser
+_start_lock = None
+
+def configure(**launch_options):
+    """Override chromium.launch options; call before the first acquire_page()"""
+    LAUNCH_OPTIONS.update(launch_options)
+
+async def _start():
+    global _playwright, _pool, _start_lock
+    if _start_lock is None:
+        _start_lock = asyncio.Lock()
+    async with _start_lock:
+        if _playwright is None:
+            playwright = await async_playwright().start()
+            # Fail up front with a clear message rather than inside launch();
+            # installs belong outside the test run (PLAYWRIGHT_BROWSERS_PATH is honoured)
+            executable = playwright.chromium.executable_path
+            if not os.path.exists(executable):
+                await playwright.stop()
+                raise RuntimeError(
+                    f"Chromium not found at {executable}; run 'playwright install chromium' first"
+                )
+            _playwright = playwright
+            _pool = asyncio.Queue(maxsize=POOL_SIZE)
+
+async def _launch():
+    browser = await _playwright.chromium.launch(**LAUNCH_OPTIONS)
+    _uses[browser] = 0
+    return browser
+
+async def _take_browser():
+    """Take an idle browser, launching one into a new or free slot"""
+    global _launched
+    if _pool.empty() and _launched < POOL_SIZE:
+        _launched += 1
+        browser = None
+    else:
+        browser = await _pool.get()
+    if browser is None:
+        try:
+            browser = await _launch()
+        except Exception:
+            # Hand the slot on so a waiter can try again instead of blocking
+            _pool.put_nowait(None)
+            raise
+    return browser
+
+def _return_browser(browser):
+    """Hand a browser back to the pool, or free its slot if it has died"""
+    if browser.is_connected():
+        _pool.put_nowait(browser)
+    else:
+        _uses.pop(browser, None)
+        _pool.put_nowait(None)
+
+async def acquire_page(**context_options):
+    """Return (page, ticket) on a fresh context from a pooled browser"""
+    await _start()
+    browser = await _take_browser()
+    context = None
+    try:
+        context = await browser.new_context(**context_options)
+        await context.route("**/*", block_unneeded_requests)
+        page = await context.new_page()
+    except Exception:
+        if context is not None:
+            try:
+                await context.close()
+            except PWError:
+                pass
+        _return_browser(browser)
+        raise
+    return page, (browser, context)
+
+async def release_page(ticket):
+    """Close the page's context and hand its browser back to the pool"""
+    browser, context = ticket
+    try:
+        await context.close()
+        _uses[browser] += 1
+        if _uses[browser] >= MAX_USES_PER_INSTANCE:
+            # Recycle the instance; the next acquire_page() relaunches into its slot
+            del _uses[browser]
+            await browser.close()
+            browser = None
+    finally:
+        if browser is None:
+            _pool.put_nowait(None)
+        else:
+            _return_browser(browser)
+
+async def shutdown():
+    """Close idle browsers and stop Playwright"""
+    global _playwright, _pool, _launched
+    if _playwright is None:
+        return
+    while not _pool.empty():
+        browser = _pool.get_nowait()
+        if browser is None:
+            continue
+        _uses.pop(browser, None)
+        await browser.close()
+    await _playwright.stop()
+    _playwright = _pool = None
+    _launched = 0
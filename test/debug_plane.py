@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 """Debug script to see what's actually on the EcoTree results page"""
 
+import os
+import sys
+
 from playwright.sync_api import sync_playwright
-import re
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_patterns import KG_KM_RE, SITE_SELECTORS
+
+ECOTREE = SITE_SELECTORS['ecotree.green']
 
 with sync_playwright() as p:
     browser = p.chromium.launch(headless=True)
@@ -20,32 +27,33 @@ with sync_playwright() as p:
     page.get_by_text('Southampton, United Kingdom').click()
     
     print("📍 Entering Newcastle...")
-    page.locator('input[name="To"]').click()
-    page.locator('input[name="To"]').fill('newcastle')
-    page.wait_for_timeout(1000)
+    page.locator(ECOTREE['to'][0]).click()
+    page.locator(ECOTREE['to'][0]).fill('newcastle')
     page.get_by_text('Newcastle').first.click()
     
     print("🔢 Clicking Calculate...")
     page.get_by_role('link', name=' Calculate my emissions ').click()
     
     print("⏳ Waiting for results...")
-    page.wait_for_timeout(5000)
+    result_locator = page.locator(ECOTREE['result']).first
+    result_locator.wait_for(timeout=15000)
     
     print(f"\n📊 Current URL: {page.url}")
     
     # Get all text content
     content = page.text_content('body')
     
-    # Find all numbers followed by kg
-    kg_matches = re.findall(r'(\d+(?:[.,]\d+)?)\s*kg', content, re.IGNORECASE)
+    # Find all numbers followed by kg or km
+    kg_matches = []
+    km_matches = []
+    for value, unit in KG_KM_RE.findall(content):
+        (kg_matches if unit.lower() == 'kg' else km_matches).append(value)
     print(f"\n🔍 All 'kg' values found: {kg_matches}")
-    
-    # Find all numbers followed by km
-    km_matches = re.findall(r'(\d+(?:[.,]\d+)?)\s*km', content, re.IGNORECASE)
     print(f"🔍 All 'km' values found: {km_matches}")
     
     # Try to find the specific result elements
     print("\n🎯 Looking for result elements...")
+    print(f"   First 'kg' element: {result_locator.text_content()!r}")
     
     # Take a screenshot
     page.screenshot(path='/tmp/ecotree_result.png')
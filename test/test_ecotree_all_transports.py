@@ -7,186 +7,158 @@ Test all three transport types on EcoTree CO2 calculator
 """
 
 import asyncio
-from playwright.async_api import async_playwright
+import os
+import sys
+import time
 
-async def test_plane():
-    """Test Plane transport"""
-    print("\n" + "=" * 60)
-    print("🛫 TESTING PLANE: Southampton → Newcastle")
-    print("=" * 60)
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, slow_mo=100)
-        page = await browser.new_page()
-        page.set_default_timeout(30000)
-        
-        try:
-            await page.goto('https://ecotree.green/en/calculate-flight-co2')
-            print("✅ Page loaded")
-            
-            await page.get_by_role('link', name='Plane').click()
-            print("✅ Clicked 'Plane'")
-            
-            await page.get_by_role('textbox', name='From To Via').click()
-            await page.get_by_role('textbox', name='From To Via').fill('southampton')
-            print("✅ Filled 'Southampton'")
-            
-            await page.get_by_text('Southampton, United Kingdom').click()
-            print("✅ Selected Southampton")
-            
-            await page.locator('input[name="To"]').click()
-            await page.locator('input[name="To"]').fill('newcastle')
-            print("✅ Filled 'Newcastle'")
-            
-            await page.get_by_text('Newcastle, United Kingdom, (').click()
-            print("✅ Selected Newcastle")
-            
-            await page.get_by_role('link', name=' Calculate my emissions ').click()
-            print("✅ Clicked Calculate")
-            
-            await page.wait_for_timeout(3000)
-            
-            # Extract results
-            try:
-                co2_text = await page.locator('text=/\\d+\\s*kg/').first.inner_text()
-                distance_text = await page.locator('text=/\\d+\\s*km/').first.inner_text()
-                print(f"\n📊 RESULTS:")
-                print(f"   ✈️  CO2: {co2_text}")
-                print(f"   📏 Distance: {distance_text}")
-                return True
-            except Exception as e:
-                print(f"   ⚠️  Could not extract results: {e}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return False
-        finally:
-            await browser.close()
+import _playwright_pool as pool
 
-async def test_train():
-    """Test Train transport"""
-    print("\n" + "=" * 60)
-    print("🚂 TESTING TRAIN: Petersfield → London Waterloo")
-    print("=" * 60)
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, slow_mo=100)
-        page = await browser.new_page()
-        page.set_default_timeout(30000)
-        
-        try:
-            # Direct navigation to train page
-            await page.goto('https://ecotree.green/en/calculate-train-co2')
-            print("✅ Page loaded (direct URL)")
-            
-            await page.wait_for_timeout(2000)
-            
-            # Fill From field
-            await page.locator('#geosuggest__input').first.fill('Petersfield')
-            print("✅ Filled 'Petersfield'")
-            
-            await page.wait_for_timeout(1000)
-            await page.get_by_text('Petersfield, UK', exact=True).click()
-            print("✅ Selected Petersfield")
-            
-            await page.wait_for_timeout(1000)
-            
-            # Fill To field
-            await page.locator('#geosuggest__input').nth(1).fill('London')
-            print("✅ Filled 'London'")
-            
-            await page.wait_for_timeout(1000)
-            await page.get_by_text('London, UK', exact=True).click()
-            print("✅ Selected London")
-            
-            await page.wait_for_timeout(1000)
-            await page.get_by_role('link', name=' Calculate my emissions ').click()
-            print("✅ Clicked Calculate")
-            
-            await page.wait_for_timeout(3000)
-            
-            # Extract results
-            try:
-                co2_text = await page.locator('text=/\\d+\\s*kg/').first.inner_text()
-                distance_text = await page.locator('text=/\\d+\\s*km/').first.inner_text()
-                print(f"\n📊 RESULTS:")
-                print(f"   🚂 CO2: {co2_text}")
-                print(f"   📏 Distance: {distance_text}")
-                return True
-            except Exception as e:
-                print(f"   ⚠️  Could not extract results: {e}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            await page.screenshot(path='/tmp/train_error.png')
-            print("📸 Screenshot saved to /tmp/train_error.png")
-            return False
-        finally:
-            await browser.close()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_patterns import ECOTREE_CO2_SELECTOR, ECOTREE_RESULTS_JS, SITE_SELECTORS
 
-async def test_car():
-    """Test Car transport"""
-    print("\n" + "=" * 60)
-    print("🚗 TESTING CAR: Portsmouth → London")
-    print("=" * 60)
+# Cookies/localStorage from a warm-up visit, reused so tests skip first-visit banners
+STATE_PATH = "/tmp/ecotree_state.json"
+STATE_TTL = 3600  # seconds
+
+ECOTREE = SITE_SELECTORS['ecotree.green']
+RESULT_LABELS = ECOTREE['result_labels']
+
+async def warm_state():
+    """Save EcoTree storage state once, reusing a recent file if present"""
+    try:
+        if time.time() - os.path.getmtime(STATE_PATH) < STATE_TTL:
+            return STATE_PATH
+    except OSError:
+        pass
+
+    page, ticket = await pool.acquire_page()
+    try:
+        await page.goto('https://ecotree.green/en/calculate-flight-co2', timeout=15000)
+        await page.wait_for_load_state("networkidle", timeout=10000)
+        # Accept the cookie banner if one is shown
+        consent = page.get_by_role('button', name='Accept').first
+        if await consent.count() and await consent.is_visible():
+            await consent.click()
+        await page.context.storage_state(path=STATE_PATH)
+        print("🍪 Saved warm browser state")
+        return STATE_PATH
+    except Exception as e:
+        print(f"⚠️  Could not warm browser state: {e}")
+        return None
+    finally:
+        await pool.release_page(ticket)
+
+# Per-transport steps; locator specs are (kind, target, options), see locate()
+TRANSPORTS = [
+    {
+        "label": "plane",
+        "title": "🛫 TESTING PLANE: Southampton → Newcastle",
+        "emoji": "✈️ ",
+        "url": "https://ecotree.green/en/calculate-flight-co2",
+        "tab": "Plane",
+        "from": ("role", "textbox", {"name": "From To Via"}),
+        "from_value": "southampton",
+        "from_pick": ("text", "Southampton, United Kingdom", {}),
+        "to": ("css", 'input[name="To"]', {}),
+        "to_value": "newcastle",
+        "to_pick": ("text", "Newcastle, United Kingdom, (", {}),
+    },
+    {
+        "label": "train",
+        "title": "🚂 TESTING TRAIN: Petersfield → London Waterloo",
+        "emoji": "🚂",
+        "url": "https://ecotree.green/en/calculate-train-co2",
+        "tab": None,
+        "from": ("css", "#geosuggest__input", {"nth": 0}),
+        "from_value": "Petersfield",
+        "from_pick": ("text", "Petersfield, UK", {"exact": True}),
+        "to": ("css", "#geosuggest__input", {"nth": 1}),
+        "to_value": "London",
+        "to_pick": ("text", "London, UK", {"exact": True}),
+    },
+    {
+        "label": "car",
+        "title": "🚗 TESTING CAR: Portsmouth → London",
+        "emoji": "🚗",
+        "url": "https://ecotree.green/en/calculate-car-co2",
+        "tab": None,
+        "from": ("css", "#geosuggest__input", {"nth": 0}),
+        "from_value": "Portsmouth",
+        "from_pick": ("text", "Portsmouth, UK", {}),
+        "to": ("css", "#geosuggest__input", {"nth": 1}),
+        "to_value": "London",
+        "to_pick": ("role", "option", {"name": "London, UK", "exact": True}),
+    },
+]
+
+def locate(page, spec):
+    """Build a locator from a ('role' | 'text' | 'css', target, options) spec"""
+    kind, target, options = spec
+    if kind == "role":
+        return page.get_by_role(target, **options)
+    if kind == "text":
+        return page.get_by_text(target, **options)
+    return page.locator(target).nth(options.get("nth", 0))
+
+async def run_transport(cfg, state):
+    """Fill one EcoTree calculator and read back CO2 and distance"""
+    # Buffer this transport's output and print it in one write at the end,
+    # so concurrent runs don't interleave line by line
+    lines = []
+    say = lines.append
+    say("\n" + "=" * 60)
+    say(cfg["title"])
+    say("=" * 60)
+    
+    page, ticket = await pool.acquire_page(storage_state=state)
+    page.set_default_timeout(10000)
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, slow_mo=100)
-        page = await browser.new_page()
-        page.set_default_timeout(30000)
+    try:
+        await page.goto(cfg["url"], timeout=15000)
+        await page.wait_for_load_state("domcontentloaded")
+        say("✅ Page loaded")
+        
+        if cfg["tab"]:
+            await page.get_by_role('link', name=cfg["tab"]).click()
+            say(f"✅ Clicked '{cfg['tab']}'")
+        
+        for field in ("from", "to"):
+            box = locate(page, cfg[field])
+            await box.click()
+            await box.fill(cfg[f"{field}_value"])
+            say(f"✅ Filled '{cfg[field + '_value']}'")
+            
+            await locate(page, cfg[f"{field}_pick"]).click()
+            say(f"✅ Selected {cfg[field + '_pick'][1]!r}")
+        
+        await page.get_by_role('link', name=' Calculate my emissions ').click()
+        say("✅ Clicked Calculate")
         
+        # Proceed as soon as the result card is rendered
+        await page.locator(ECOTREE_CO2_SELECTOR).or_(page.locator('text=/\\d+\\s*kg/')).first.wait_for(timeout=10000)
+        
+        # Extract results
         try:
-            # Direct navigation to car page
-            await page.goto('https://ecotree.green/en/calculate-car-co2')
-            print("✅ Page loaded (direct URL)")
-            
-            await page.wait_for_timeout(2000)
-            
-            # Fill From field
-            await page.locator('#geosuggest__input').first.fill('Portsmouth')
-            print("✅ Filled 'Portsmouth'")
-            
-            await page.wait_for_timeout(1000)
-            await page.get_by_text('Portsmouth, UK').click()
-            print("✅ Selected Portsmouth")
-            
-            await page.wait_for_timeout(1000)
-            
-            # Fill To field
-            await page.locator('#geosuggest__input').nth(1).fill('London')
-            print("✅ Filled 'London'")
-            
-            await page.wait_for_timeout(1000)
-            await page.get_by_role('option', name='London, UK', exact=True).click()
-            print("✅ Selected London")
-            
-            await page.wait_for_timeout(1000)
-            await page.get_by_role('link', name=' Calculate my emissions ').click()
-            print("✅ Clicked Calculate")
-            
-            await page.wait_for_timeout(3000)
-            
-            # Extract results
-            try:
-                co2_text = await page.locator('text=/\\d+\\s*kg/').first.inner_text()
-                distance_text = await page.locator('text=/\\d+\\s*km/').first.inner_text()
-                print(f"\n📊 RESULTS:")
-                print(f"   🚗 CO2: {co2_text}")
-                print(f"   📏 Distance: {distance_text}")
-                return True
-            except Exception as e:
-                print(f"   ⚠️  Could not extract results: {e}")
-                return False
-                
+            co2_text, distance_text = await page.evaluate(ECOTREE_RESULTS_JS, RESULT_LABELS)
+            if not (co2_text and distance_text):
+                raise ValueError(f"CO2={co2_text!r}, distance={distance_text!r}")
+            say(f"\n📊 RESULTS:")
+            say(f"   {cfg['emoji']} CO2: {co2_text}")
+            say(f"   📏 Distance: {distance_text}")
+            return True
         except Exception as e:
-            print(f"❌ Error: {e}")
-            await page.screenshot(path='/tmp/car_error.png')
-            print("📸 Screenshot saved to /tmp/car_error.png")
+            say(f"   ⚠️  Could not extract results: {e}")
             return False
-        finally:
-            await browser.close()
+            
+    except Exception as e:
+        say(f"❌ Error: {e}")
+        screenshot = f"/tmp/{cfg['label']}_error.png"
+        await page.screenshot(path=screenshot)
+        say(f"📸 Screenshot saved to {screenshot}")
+        return False
+    finally:
+        await pool.release_page(ticket)
+        print("\n".join(lines), flush=True)
 
 async def main():
     """Run all tests"""
@@ -194,18 +166,20 @@ async def main():
     print("EcoTree CO2 Calculator - Testing All Transport Types")
     print("🌍 " * 20)
     
-    results = {}
-    
-    # Test Plane
-    results['plane'] = await test_plane()
-    await asyncio.sleep(2)
-    
-    # Test Train
-    results['train'] = await test_train()
-    await asyncio.sleep(2)
-    
-    # Test Car
-    results['car'] = await test_car()
+    # Browsers come from the shared pool; each test gets its own context
+    try:
+        state = await warm_state()
+        # Tests are independent, so run them concurrently
+        outcomes = await asyncio.gather(
+            *(run_transport(cfg, state) for cfg in TRANSPORTS),
+            return_exceptions=True
+        )
+    finally:
+        await pool.shutdown()
+    results = {
+        cfg["label"]: outcome is True
+        for cfg, outcome in zip(TRANSPORTS, outcomes)
+    }
     
     # Summary
     print("\n" + "=" * 60)
@@ -5,7 +5,16 @@ Route: Petersfield → London Waterloo
 """
 
 import asyncio
-from playwright.async_api import async_playwright
+import os
+import sys
+
+import _playwright_pool as pool
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_patterns import ECOTREE_CO2_SELECTOR, ECOTREE_RESULTS_JS, SITE_SELECTORS
+
+ECOTREE = SITE_SELECTORS['ecotree.green']
+RESULT_LABELS = ECOTREE['result_labels']
 
 async def test_ecotree_train():
     print("🚂 Testing EcoTree Train CO2 Calculator")
@@ -13,165 +22,159 @@ async def test_ecotree_train():
     print("Route: Petersfield → London Waterloo")
     print()
 
-    async with async_playwright() as p:
-        # Launch browser
-        print("🌐 Launching browser...")
-        browser = await p.chromium.launch(headless=False, slow_mo=500)  # Visible + slow for debugging
-        page = await browser.new_page()
+    # Browser comes from the shared pool (visible + slow with ECOTREE_DEBUG=1)
+    print("🌐 Launching browser...")
+    if pool.DEBUG:
+        pool.configure(slow_mo=500)
+    page, ticket = await pool.acquire_page()
+    
+    # Fail fast; goto gets a little longer for the first load
+    page.set_default_timeout(10000)  # 10 seconds
+    
+    try:
+        # Navigate to the page
+        print("📍 Navigating to EcoTree...")
+        await page.goto('https://ecotree.green/en/calculate-flight-co2', timeout=15000)
+        print("✅ Page loaded")
         
-        # Set longer timeout for debugging
-        page.set_default_timeout(60000)  # 60 seconds
+        # Click on Train tab
+        print("\n🚂 Clicking 'Train' tab...")
+        await page.get_by_role('link', name='Train').click()
+        print("✅ Clicked 'Train'")
         
-        try:
-            # Navigate to the page
-            print("📍 Navigating to EcoTree...")
-            await page.goto('https://ecotree.green/en/calculate-flight-co2')
-            print("✅ Page loaded")
-            
-            # Click on Train tab
-            print("\n🚂 Clicking 'Train' tab...")
-            await page.get_by_role('link', name='Train').click()
-            print("✅ Clicked 'Train'")
-            
-            # Wait and see what happens
-            print("\n⏳ Waiting 3 seconds for form to load...")
-            await page.wait_for_timeout(3000)
-            
-            # Take a screenshot
+        # Wait for the form's text inputs rather than a fixed delay
+        print("\n⏳ Waiting for form to load...")
+        await page.locator('input[type="text"]:visible').first.wait_for()
+        
+        # Take a screenshot (debug runs only; failures always get one below)
+        if pool.DEBUG:
             await page.screenshot(path='/tmp/ecotree_train_after_click.png')
             print("📸 Screenshot saved to /tmp/ecotree_train_after_click.png")
-            
-            # Try to inspect the form
-            print("\n🔍 Inspecting form elements...")
-            
-            # Check for textbox with "From To Via"
-            try:
-                textbox = page.get_by_role('textbox', name='From To Via')
-                is_visible = await textbox.is_visible()
-                print(f"   'From To Via' textbox visible: {is_visible}")
-            except Exception as e:
-                print(f"   ❌ 'From To Via' textbox not found: {e}")
-            
-            # Check for input[name="From"]
-            try:
-                from_input = page.locator('input[name="From"]')
-                count = await from_input.count()
-                if count > 0:
-                    is_visible = await from_input.first.is_visible()
-                    placeholder = await from_input.first.get_attribute('placeholder')
-                    print(f"   input[name='From'] found: {count} elements, visible: {is_visible}, placeholder: {placeholder}")
-                else:
-                    print(f"   input[name='From'] not found")
-            except Exception as e:
-                print(f"   ❌ Error checking input[name='From']: {e}")
-            
-            # Check for any visible input elements
-            try:
-                all_inputs = page.locator('input[type="text"]:visible')
-                count = await all_inputs.count()
-                print(f"   Total visible text inputs: {count}")
-                for i in range(min(count, 5)):  # Show first 5
-                    input_elem = all_inputs.nth(i)
-                    name = await input_elem.get_attribute('name')
-                    placeholder = await input_elem.get_attribute('placeholder')
-                    print(f"     [{i}] name='{name}', placeholder='{placeholder}'")
-            except Exception as e:
-                print(f"   ❌ Error listing inputs: {e}")
-            
-            print("\n" + "=" * 60)
-            print("🔍 Now attempting to fill the form...")
-            print("=" * 60)
-            
-            # Try METHOD 1: Using role-based selector
+        
+        # Try to inspect the form
+        print("\n🔍 Inspecting form elements...")
+        
+        # Check for textbox with "From To Via"
+        try:
+            textbox = page.get_by_role('textbox', name='From To Via')
+            is_visible = await textbox.is_visible()
+            print(f"   'From To Via' textbox visible: {is_visible}")
+        except Exception as e:
+            print(f"   ❌ 'From To Via' textbox not found: {e}")
+        
+        # Check for input[name="From"]
+        try:
+            from_input = page.locator('input[name="From"]')
+            count = await from_input.count()
+            if count > 0:
+                is_visible = await from_input.first.is_visible()
+                placeholder = await from_input.first.get_attribute('placeholder')
+                print(f"   input[name='From'] found: {count} elements, visible: {is_visible}, placeholder: {placeholder}")
+            else:
+                print(f"   input[name='From'] not found")
+        except Exception as e:
+            print(f"   ❌ Error checking input[name='From']: {e}")
+        
+        # Check for any visible input elements
+        try:
+            all_inputs = page.locator('input[type="text"]:visible')
+            count = await all_inputs.count()
+            print(f"   Total visible text inputs: {count}")
+            
+            async def describe(i):
+                input_elem = all_inputs.nth(i)
+                return i, *await asyncio.gather(
+                    input_elem.get_attribute('name'),
+                    input_elem.get_attribute('placeholder')
+                )
+            
+            # Fetch attributes for the first 5 inputs concurrently
+            rows = await asyncio.gather(*(describe(i) for i in range(min(count, 5))))
+            for i, name, placeholder in rows:
+                print(f"     [{i}] name='{name}', placeholder='{placeholder}'")
+        except Exception as e:
+            print(f"   ❌ Error listing inputs: {e}")
+        
+        print("\n" + "=" * 60)
+        print("🔍 Now attempting to fill the form...")
+        print("=" * 60)
+        
+        # Probe once for the field that is present, then fill it with a
+        # single strategy instead of waiting out timeouts on the others
+        role_box = page.get_by_role('textbox', name='From To Via')
+        name_box = page.locator('input[name="From"]')
+        role_count, name_count = await asyncio.gather(role_box.count(), name_box.count())
+        if role_count:
             print("\n📝 Method 1: Using getByRole textbox...")
-            try:
-                await page.get_by_role('textbox', name='From To Via').click()
-                print("   ✅ Clicked textbox")
-                await page.get_by_role('textbox', name='From To Via').fill('Petersfield')
-                print("   ✅ Filled 'Petersfield'")
-                await page.wait_for_timeout(1000)
-                await page.get_by_text('Petersfield').click()
-                print("   ✅ Selected 'Petersfield' from dropdown")
-            except Exception as e:
-                print(f"   ❌ Method 1 failed: {e}")
-                
-                # Try METHOD 2: Direct input selector
-                print("\n📝 Method 2: Using input[name='From']...")
-                try:
-                    await page.locator('input[name="From"]').fill('Petersfield')
-                    print("   ✅ Filled 'Petersfield'")
-                    await page.wait_for_timeout(1000)
-                    await page.get_by_text('Petersfield').click()
-                    print("   ✅ Selected 'Petersfield' from dropdown")
-                except Exception as e2:
-                    print(f"   ❌ Method 2 failed: {e2}")
-                    
-                    # Try METHOD 3: Wait for selector first
-                    print("\n📝 Method 3: Wait for selector then fill...")
-                    try:
-                        await page.wait_for_selector('input[type="text"]:visible', timeout=10000)
-                        first_input = page.locator('input[type="text"]:visible').first
-                        await first_input.fill('Petersfield')
-                        print("   ✅ Filled 'Petersfield' in first visible input")
-                        await page.wait_for_timeout(1000)
-                        await page.get_by_text('Petersfield').click()
-                        print("   ✅ Selected 'Petersfield' from dropdown")
-                    except Exception as e3:
-                        print(f"   ❌ Method 3 failed: {e3}")
-                        raise
-            
-            # Fill destination
-            print("\n📝 Filling destination (London Waterloo)...")
-            await page.locator('input[name="To"]').fill('London Waterloo')
-            print("   ✅ Filled 'London Waterloo'")
-            await page.wait_for_timeout(1000)
-            
-            # Click on the suggestion
-            await page.get_by_text('Waterloo, London').click()
-            print("   ✅ Selected 'Waterloo, London' from dropdown")
-            
-            # Click Calculate
-            print("\n🧮 Clicking 'Calculate my emissions'...")
-            await page.get_by_role('link', name='Calculate my emissions').click()
-            await page.wait_for_timeout(3000)
-            print("   ✅ Clicked calculate")
-            
-            # Extract results
-            print("\n📊 Extracting results...")
-            
-            # Try to get CO2 emissions
-            try:
-                co2_text = await page.locator('text=/\\d+\\s*kg/').first.inner_text()
-                print(f"   ✈️  CO2 Emissions: {co2_text}")
-            except:
-                print("   ⚠️  Could not extract CO2 emissions")
-            
-            # Try to get distance
-            try:
-                distance_text = await page.locator('text=/\\d+\\s*km/').first.inner_text()
-                print(f"   📏 Distance: {distance_text}")
-            except:
-                print("   ⚠️  Could not extract distance")
-            
-            # Take final screenshot
+            from_input = role_box
+            await from_input.click()
+            print("   ✅ Clicked textbox")
+        elif name_count:
+            print("\n📝 Method 2: Using input[name='From']...")
+            from_input = name_box
+        else:
+            print("\n📝 Method 3: Using first visible text input...")
+            from_input = page.locator('input[type="text"]:visible').first
+        
+        try:
+            await from_input.fill('Petersfield')
+            print("   ✅ Filled 'Petersfield'")
+            await page.get_by_text('Petersfield').click()
+            print("   ✅ Selected 'Petersfield' from dropdown")
+        except Exception as e:
+            print(f"   ❌ Filling 'From' failed: {e}")
+            raise
+        
+        # Fill destination
+        print("\n📝 Filling destination (London Waterloo)...")
+        await page.locator('input[name="To"]').fill('London Waterloo')
+        print("   ✅ Filled 'London Waterloo'")
+        
+        # Click on the suggestion
+        await page.get_by_text('Waterloo, London').click()
+        print("   ✅ Selected 'Waterloo, London' from dropdown")
+        
+        # Click Calculate
+        print("\n🧮 Clicking 'Calculate my emissions'...")
+        await page.get_by_role('link', name='Calculate my emissions').click()
+        await page.locator(ECOTREE_CO2_SELECTOR).or_(page.locator('text=/\\d+\\s*kg/')).first.wait_for(timeout=10000)
+        print("   ✅ Clicked calculate")
+        
+        # Extract results
+        print("\n📊 Extracting results...")
+        
+        co2_text, distance_text = await page.evaluate(ECOTREE_RESULTS_JS, RESULT_LABELS)
+        if co2_text:
+            print(f"   ✈️  CO2 Emissions: {co2_text}")
+        else:
+            print("   ⚠️  Could not extract CO2 emissions")
+        if distance_text:
+            print(f"   📏 Distance: {distance_text}")
+        else:
+            print("   ⚠️  Could not extract distance")
+        
+        # Take final screenshot
+        if pool.DEBUG:
             await page.screenshot(path='/tmp/ecotree_train_result.png')
             print("\n📸 Final screenshot saved to /tmp/ecotree_train_result.png")
-            
-            print("\n" + "=" * 60)
-            print("✅ Test completed!")
-            print("=" * 60)
-            
-            # Keep browser open for inspection
+        
+        print("\n" + "=" * 60)
+        print("✅ Test completed!")
+        print("=" * 60)
+        
+        # Keep browser open for inspection
+        if pool.DEBUG:
             print("\n⏸️  Browser will stay open for 10 seconds for inspection...")
             await page.wait_for_timeout(10000)
-            
-        except Exception as e:
-            print(f"\n❌ Error: {e}")
-            await page.screenshot(path='/tmp/ecotree_train_error.png')
-            print("📸 Error screenshot saved to /tmp/ecotree_train_error.png")
-            raise
-        finally:
-            await browser.close()
+        
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        await page.screenshot(path='/tmp/ecotree_train_error.png')
+        print("📸 Error screenshot saved to /tmp/ecotree_train_error.png")
+        raise
+    finally:
+        await pool.release_page(ticket)
+        await pool.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(test_ecotree_train())
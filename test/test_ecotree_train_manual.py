@@ -5,52 +5,62 @@ Leaves browser open so you can inspect the form structure
 """
 
 import asyncio
-from playwright.async_api import async_playwright
+
+import _playwright_pool as pool
+
+# Attributes of every <input>, collected in one browser round-trip
+INPUTS_JS = """
+() => [...document.querySelectorAll('input')].map(el => ({
+    type: el.getAttribute('type'),
+    name: el.getAttribute('name'),
+    id: el.getAttribute('id'),
+    placeholder: el.getAttribute('placeholder'),
+    aria_label: el.getAttribute('aria-label'),
+    visible: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+}))
+"""
 
 async def inspect_train_form():
     print("🚂 Inspecting EcoTree Train Form")
     print("=" * 60)
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page()
-        
-        print("📍 Navigating to EcoTree...")
-        await page.goto('https://ecotree.green/en/calculate-flight-co2')
-        
-        print("🚂 Clicking 'Train' tab...")
-        await page.get_by_role('link', name='Train').click()
-        
-        print("\n⏳ Waiting 3 seconds...")
-        await page.wait_for_timeout(3000)
-        
-        print("\n🔍 Checking ALL input elements:")
-        inputs = await page.locator('input').all()
-        for i, inp in enumerate(inputs):
-            input_type = await inp.get_attribute('type')
-            name = await inp.get_attribute('name')
-            placeholder = await inp.get_attribute('placeholder')
-            aria_label = await inp.get_attribute('aria-label')
-            input_id = await inp.get_attribute('id')
-            is_visible = await inp.is_visible()
-            print(f"  Input [{i}]:")
-            print(f"    type={input_type}, name={name}, id={input_id}")
-            print(f"    placeholder={placeholder}")
-            print(f"    aria-label={aria_label}")
-            print(f"    visible={is_visible}")
-            print()
-        
-        print("=" * 60)
-        print("✅ Browser is open - you can manually inspect the page")
-        print("   Press Ctrl+C when done")
-        print("=" * 60)
-        
-        # Keep browser open indefinitely
-        try:
-            while True:
-                await page.wait_for_timeout(60000)
-        except KeyboardInterrupt:
-            print("\n👋 Closing browser...")
+    # Always visible: this script is for manual inspection
+    pool.configure(headless=False)
+    page, ticket = await pool.acquire_page()
+    
+    print("📍 Navigating to EcoTree...")
+    await page.goto('https://ecotree.green/en/calculate-flight-co2')
+    
+    print("🚂 Clicking 'Train' tab...")
+    await page.get_by_role('link', name='Train').click()
+    
+    print("\n⏳ Waiting 3 seconds...")
+    await page.wait_for_timeout(3000)
+    
+    print("\n🔍 Checking ALL input elements:")
+    inputs = await page.evaluate(INPUTS_JS)
+    for i, inp in enumerate(inputs):
+        print(f"  Input [{i}]:")
+        print(f"    type={inp['type']}, name={inp['name']}, id={inp['id']}")
+        print(f"    placeholder={inp['placeholder']}")
+        print(f"    aria-label={inp['aria_label']}")
+        print(f"    visible={inp['visible']}")
+        print()
+    
+    print("=" * 60)
+    print("✅ Browser is open - you can manually inspect the page")
+    print("   Press Ctrl+C when done")
+    print("=" * 60)
+    
+    # Keep browser open indefinitely
+    try:
+        while True:
+            await page.wait_for_timeout(60000)
+    except KeyboardInterrupt:
+        print("\n👋 Closing browser...")
+    finally:
+        await pool.release_page(ticket)
+        await pool.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(inspect_train_form())
@@ -1,15 +1,48 @@
 #!/usr/bin/env python3
-import requests
+import asyncio
 import json
 import time
 import sys
 
-# Configuration
-HDN_URL = "http://localhost:8081"
+import _mcp_client
+from _mcp_client import HDN_URL
+
 # Nationwide Savings & ISAs page
 TARGET_URL = "https://www.nationwide.co.uk/savings/compare-savings-accounts-and-isas/"
 
-def test_auto_config_generation():
+# Upper bound on the MCP response size; a whole scraped page fits well within it
+MAX_RESPONSE_BYTES = 32 * 1024 * 1024
+
+_DECODER = json.JSONDecoder()
+
+def _first_json_object(text):
+    """Return the first JSON object embedded in text, or None"""
+    # raw_decode scans forward from each '{' in C and stops at the matching
+    # '}', so there is no backtracking from the end of the text
+    start = text.find('{')
+    while start != -1:
+        try:
+            return _DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            start = text.find('{', start + 1)
+    return None
+
+def _tool_data(tool_result, text):
+    """Return the tool's JSON payload, parsing the text only when necessary"""
+    # MCP servers may attach the parsed object directly; no reparse needed
+    structured = tool_result.get("structuredContent")
+    if isinstance(structured, dict):
+        return structured
+    # A bare JSON text item parses in one pass without a scan for '{'
+    if text.startswith('{'):
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+    # Legacy responses wrap the JSON in a "Scrape Results:" style prefix
+    return _first_json_object(text)
+
+async def test_auto_config_generation():
     print("\n🧪 Testing Nationwide with Auto Playwright Config Generation...")
     
     # 1. Send request WITHOUT config (let LLM generate it)
@@ -41,14 +74,27 @@ def test_auto_config_generation():
     
     try:
         start_time = time.time()
-        resp = requests.post(f"{HDN_URL}/mcp", json=payload, timeout=120)
+        client = _mcp_client.get_client()
+        # Stream the body so errors and oversized scrapes are rejected
+        # before the whole response is buffered
+        async with client.stream("POST", "/mcp", json=payload) as resp:
+            if resp.status_code != 200:
+                await resp.aread()
+                print(f"   ❌ HTTP Error {resp.status_code}: {resp.text}")
+                return False
+
+            chunks = []
+            size = 0
+            async for chunk in resp.aiter_bytes():
+                size += len(chunk)
+                if size > MAX_RESPONSE_BYTES:
+                    print(f"   ❌ Response exceeds {MAX_RESPONSE_BYTES // (1024 * 1024)} MB, aborting")
+                    return False
+                chunks.append(chunk)
         duration = time.time() - start_time
-        
-        if resp.status_code != 200:
-            print(f"   ❌ HTTP Error {resp.status_code}: {resp.text}")
-            return False
 
-        result = resp.json()
+        result = json.loads(b"".join(chunks))
+        del chunks
         if "error" in result:
             print(f"   ❌ JSON-RPC Error: {result['error']}")
             return False
@@ -79,12 +125,9 @@ def test_auto_config_generation():
                 
                 # Check if we got expected data
                 try:
-                    # Clean up "Scrape Results:" prefix if present
-                    clean_json = text_content
-                    if "Scrape Results:" in clean_json:
-                        clean_json = clean_json.split("Scrape Results:", 1)[1].strip()
-                    
-                    data = json.loads(clean_json)
+                    data = _tool_data(tool_result, text_content)
+                    if data is None:
+                        raise json.JSONDecodeError("No JSON object found", text_content, 0)
                     
                     # Print found keys
                     print(f"\n   🔍 Raw Result Keys: {list(data.keys())}")
@@ -131,8 +174,14 @@ def test_auto_config_generation():
         print(f"   ❌ Exception: {e}")
         return False
 
+async def main():
+    try:
+        return await test_auto_config_generation()
+    finally:
+        await _mcp_client.aclose()
+
 if __name__ == "__main__":
-    if test_auto_config_generation():
+    if asyncio.run(main()):
         sys.exit(0)
     else:
         sys.exit(1)
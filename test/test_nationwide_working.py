@@ -1,55 +1,82 @@
 import requests
-from bs4 import BeautifulSoup
-import json
+import re
 import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from _fastjson import loads, pretty
 
 # URL
 url = "https://www.nationwide.co.uk/savings/compare-savings-accounts-and-isas/"
 
+# Next.js embeds page data as JSON in this script tag; slicing it out of the
+# raw bytes avoids decoding and parsing the whole page
+_NEXT_RE = re.compile(rb'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.DOTALL)
+
+def _read_until_next_data(response):
+    """Read the body only as far as the end of the __NEXT_DATA__ script"""
+    buf = bytearray()
+    start = -1
+    for chunk in response.iter_content(65536):
+        # Only rescan the new bytes (plus overlap for a split marker)
+        scan_from = max(0, len(buf) - 16)
+        buf.extend(chunk)
+        if start == -1:
+            start = buf.find(b'__NEXT_DATA__', scan_from)
+            if start == -1:
+                continue
+            scan_from = start
+        if buf.find(b'</script>', scan_from) != -1:
+            break
+    return bytes(buf)
+
+def _parse_aer(aer):
+    """Return aer as a float, or None if missing or non-numeric"""
+    try:
+        return float(aer)
+    except (TypeError, ValueError):
+        return None
+
 try:
     # Fetch content
     print(f"Fetching {url}...", file=sys.stderr)
-    r = requests.get(url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"})
-    r.raise_for_status()
-    
-    # Parse HTML
-    soup = BeautifulSoup(r.text, 'html.parser')
+    with requests.get(url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"}, stream=True) as r:
+        r.raise_for_status()
+        page = _read_until_next_data(r)
     
     # Find Next.js data
-    script = soup.find('script', id='__NEXT_DATA__')
+    script = _NEXT_RE.search(page)
     if not script:
         print("Error: Could not find __NEXT_DATA__ script tag.", file=sys.stderr)
         sys.exit(1)
         
     # Load JSON
-    data = json.loads(script.string)
+    data = loads(script.group(1))
     
     # Determine Extraction Method
     # Path: props -> pageProps -> additionalData -> SavingsRatesTable -> products
     
-    products = []
+    # The path is almost always present, so index straight down it
     try:
-        if 'props' in data and 'pageProps' in data['props']:
-             pp = data['props']['pageProps']
-             if 'additionalData' in pp and 'SavingsRatesTable' in pp['additionalData']:
-                  products = pp['additionalData']['SavingsRatesTable']['products']
-    except Exception as e:
-        print(f"Traverse error: {e}", file=sys.stderr)
+        products = data['props']['pageProps']['additionalData']['SavingsRatesTable']['products']
+    except (KeyError, TypeError):
+        products = None
 
     if not products:
-        # Fallback recursive search for 'products' key if exact path fails
+        # Fallback search for 'products' key if exact path fails; an explicit
+        # stack avoids a Python call per node and the recursion limit
         def find_products(d):
-            if isinstance(d, dict):
-                for k, v in d.items():
-                    if k == 'products' and isinstance(v, list) and len(v) > 0 and 'name' in v[0]:
+            stack = [d]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    v = node.get('products')
+                    if isinstance(v, list) and v and isinstance(v[0], dict) and 'name' in v[0]:
                         return v
-                    if isinstance(v, (dict, list)):
-                        found = find_products(v)
-                        if found: return found
-            elif isinstance(d, list):
-                for item in d:
-                    found = find_products(item)
-                    if found: return found
+                    # Reversed so children are visited in document order
+                    stack.extend(reversed(list(node.values())))
+                elif isinstance(node, list):
+                    stack.extend(reversed(node))
             return None
         products = find_products(data)
 
@@ -67,31 +94,22 @@ try:
         issues = p.get('issues', [])
         rate_str = "N/A"
         
-        # Try to find max AER across subproducts/tiers
-        max_aer = 0.0
-        found_aer = False
-        
-        for issue in issues:
-            subproducts = issue.get('subproducts', [])
-            for sub in subproducts:
-                tiers = sub.get('rateTiers', [])
-                for tier in tiers:
-                    aer = tier.get('aer')
-                    if aer is not None:
-                        try:
-                            val = float(aer)
-                            if val > max_aer: 
-                                max_aer = val
-                                found_aer = True
-                        except: pass
+        # Max AER across subproducts/tiers, reduced by the max() builtin
+        aers = (
+            _parse_aer(tier.get('aer'))
+            for issue in issues
+            for sub in issue.get('subproducts', ())
+            for tier in sub.get('rateTiers', ())
+        )
+        max_aer = max((aer for aer in aers if aer is not None), default=0.0)
                         
-        if found_aer:
+        if max_aer > 0.0:
             rate_str = f"{max_aer}% AER"
             
         results.append({"product": name, "rate": rate_str})
         
     # Print Clean Output
-    print(json.dumps(results, indent=2))
+    print(pretty(results))
         
 except Exception as e:
     print(f"Exception: {e}", file=sys.stderr)
@@ -4,26 +4,43 @@ Test script to verify the Scraper Agent is functioning properly.
 Tests direct scraper invocation and agent registration.
 """
 
-import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
+import random
 import time
 import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from _fastjson import loads, pretty
+from _http_session import new_session
 
 HDN_URL = "http://localhost:8081"
 SCRAPER_URL = "http://localhost:8085"
 
-def test_scraper_agent_registered():
+# One keep-alive session for every call, including the job status poll loop
+_SESSION = new_session()
+
+def _run_buffered(test):
+    """Run test(say) with its output collected, so concurrent tests print in order"""
+    lines = []
+
+    def say(*args):
+        lines.append(" ".join(str(a) for a in args))
+
+    return test(say), lines
+
+def test_scraper_agent_registered(say=print):
     """Check if scraper_agent is registered with correct tools."""
-    print("\n🧪 Test 1: Scraper Agent Registration")
-    print("=" * 60)
+    say("\n🧪 Test 1: Scraper Agent Registration")
+    say("=" * 60)
     
     try:
-        resp = requests.get(f"{HDN_URL}/api/v1/agents", timeout=10)
+        resp = _SESSION.get(f"{HDN_URL}/api/v1/agents", timeout=10)
         if resp.status_code != 200:
-            print(f"❌ Failed to list agents: {resp.status_code}")
+            say(f"❌ Failed to list agents: {resp.status_code}")
             return False
         
-        agents = resp.json().get("agents", [])
+        agents = loads(resp.content).get("agents", [])
         scraper_agent = None
         
         for agent in agents:
@@ -32,13 +49,13 @@ def test_scraper_agent_registered():
                 break
         
         if not scraper_agent:
-            print("❌ Scraper agent NOT found in registry")
+            say("❌ Scraper agent NOT found in registry")
             return False
         
-        print(f"✅ Scraper agent found:")
-        print(f"   Name: {scraper_agent.get('name')}")
-        print(f"   Role: {scraper_agent.get('role')}")
-        print(f"   Goal: {scraper_agent.get('goal')}")
+        say(f"✅ Scraper agent found:")
+        say(f"   Name: {scraper_agent.get('name')}")
+        say(f"   Role: {scraper_agent.get('role')}")
+        say(f"   Goal: {scraper_agent.get('goal')}")
         
         # Check tools
         tools = scraper_agent.get("tools", [])
@@ -46,20 +63,20 @@ def test_scraper_agent_registered():
         missing_tools = [t for t in required_tools if t not in tools]
         
         if missing_tools:
-            print(f"❌ Missing tools: {missing_tools}")
+            say(f"❌ Missing tools: {missing_tools}")
             return False
         
-        print(f"✅ All required tools present: {tools}")
+        say(f"✅ All required tools present: {tools}")
         return True
         
     except Exception as e:
-        print(f"❌ Exception: {e}")
+        say(f"❌ Exception: {e}")
         return False
 
-def test_smart_scrape_mcp_tool():
+def test_smart_scrape_mcp_tool(say=print):
     """Test that smart_scrape MCP tool works directly."""
-    print("\n🧪 Test 2: Smart Scrape MCP Tool (Direct)")
-    print("=" * 60)
+    say("\n🧪 Test 2: Smart Scrape MCP Tool (Direct)")
+    say("=" * 60)
     
     payload = {
         "jsonrpc": "2.0",
@@ -75,59 +92,59 @@ def test_smart_scrape_mcp_tool():
     }
     
     try:
-        print("Calling /mcp endpoint with smart_scrape tool...")
-        resp = requests.post(f"{HDN_URL}/mcp", json=payload, timeout=60)
+        say("Calling /mcp endpoint with smart_scrape tool...")
+        resp = _SESSION.post(f"{HDN_URL}/mcp", json=payload, timeout=60)
         
         if resp.status_code != 200:
-            print(f"❌ HTTP Error {resp.status_code}: {resp.text}")
+            say(f"❌ HTTP Error {resp.status_code}: {resp.text}")
             return False
         
-        result = resp.json()
-        print(f"✅ Got response: {json.dumps(result, indent=2)[:500]}...")
+        result = loads(resp.content)
+        say(f"✅ Got response: {pretty(result)[:500]}...")
         
         # Check for error in result
         if "error" in result:
-            print(f"❌ JSON-RPC Error: {result['error']}")
+            say(f"❌ JSON-RPC Error: {result['error']}")
             return False
         
         # Check for content
         if "result" in result and "content" in result["result"]:
             content = result["result"]["content"]
             if content and len(content) > 0:
-                print(f"✅ Tool returned {len(content)} content items")
+                say(f"✅ Tool returned {len(content)} content items")
                 for item in content:
                     if "text" in item:
                         text = item["text"]
                         if "Example Domain" in text:
-                            print(f"✅ Found expected content: 'Example Domain'")
+                            say(f"✅ Found expected content: 'Example Domain'")
                             return True
         
-        print(f"⚠️ Tool executed but no expected content in response")
+        say(f"⚠️ Tool executed but no expected content in response")
         return False
         
     except Exception as e:
-        print(f"❌ Exception: {e}")
+        say(f"❌ Exception: {e}")
         return False
 
-def test_scraper_service_direct():
+def test_scraper_service_direct(say=print):
     """Test Playwright scraper service directly."""
-    print("\n🧪 Test 3: Playwright Scraper Service (Direct)")
-    print("=" * 60)
+    say("\n🧪 Test 3: Playwright Scraper Service (Direct)")
+    say("=" * 60)
     
     # Health check
     try:
-        print(f"Checking scraper health at {SCRAPER_URL}/health...")
-        resp = requests.get(f"{SCRAPER_URL}/health", timeout=10)
+        say(f"Checking scraper health at {SCRAPER_URL}/health...")
+        resp = _SESSION.get(f"{SCRAPER_URL}/health", timeout=10)
         
         if resp.status_code != 200:
-            print(f"❌ Scraper health check failed: {resp.status_code}")
+            say(f"❌ Scraper health check failed: {resp.status_code}")
             return False
         
-        health = resp.json()
-        print(f"✅ Scraper is healthy: {health}")
+        health = loads(resp.content)
+        say(f"✅ Scraper is healthy: {health}")
         
         # Try a scrape job
-        print("\nSubmitting scrape job...")
+        say("\nSubmitting scrape job...")
         job_payload = {
             "url": "https://example.com",
             "typescript_config": "",
@@ -136,48 +153,53 @@ def test_scraper_service_direct():
             }
         }
         
-        resp = requests.post(f"{SCRAPER_URL}/scrape/start", json=job_payload, timeout=10)
+        resp = _SESSION.post(f"{SCRAPER_URL}/scrape/start", json=job_payload, timeout=10)
         if resp.status_code != 200:
-            print(f"❌ Failed to start scrape job: {resp.status_code}")
+            say(f"❌ Failed to start scrape job: {resp.status_code}")
             return False
         
-        job_result = resp.json()
+        job_result = loads(resp.content)
         job_id = job_result.get("job_id")
-        print(f"✅ Job started: {job_id}")
+        say(f"✅ Job started: {job_id}")
         
         # Poll for result
-        print("Waiting for job completion...")
-        for i in range(30):  # 30 * 1 second = 30 seconds
-            resp = requests.get(
+        say("Waiting for job completion...")
+        # Poll quickly at first, backing off to 1 s, within a 30 s budget
+        start = time.monotonic()
+        deadline = start + 30
+        delay = 0.05
+        while time.monotonic() < deadline:
+            resp = _SESSION.get(
                 f"{SCRAPER_URL}/scrape/job",
                 params={"job_id": job_id},
                 timeout=10
             )
             
             if resp.status_code != 200:
-                print(f"❌ Failed to poll job: {resp.status_code}")
+                say(f"❌ Failed to poll job: {resp.status_code}")
                 return False
             
-            job_status = resp.json()
+            job_status = loads(resp.content)
             status = job_status.get("status")
             
             if status == "completed":
-                print(f"✅ Job completed!")
+                say(f"✅ Job completed!")
                 result = job_status.get("result", {})
-                print(f"   Result: {json.dumps(result, indent=2)}")
+                say(f"   Result: {pretty(result)}")
                 return True
             elif status == "failed":
-                print(f"❌ Job failed: {job_status.get('error')}")
+                say(f"❌ Job failed: {job_status.get('error')}")
                 return False
             
-            print(f"   [{i}s] Status: {status}")
-            time.sleep(1)
+            say(f"   [{time.monotonic() - start:.1f}s] Status: {status}")
+            time.sleep(delay + random.random() * 0.01)
+            delay = min(delay * 1.6, 1.0)
         
-        print("❌ Job timed out after 30 seconds")
+        say("❌ Job timed out after 30 seconds")
         return False
         
     except Exception as e:
-        print(f"❌ Exception: {e}")
+        say(f"❌ Exception: {e}")
         return False
 
 def main():
@@ -187,10 +209,14 @@ def main():
     
     success = True
     
-    # Run tests
-    if not test_scraper_agent_registered(): success = False
-    if not test_smart_scrape_mcp_tool(): success = False
-    if not test_scraper_service_direct(): success = False
+    # The three checks are independent, so run them concurrently on the
+    # shared session and print each one's output in order afterwards
+    tests = (test_scraper_agent_registered, test_smart_scrape_mcp_tool, test_scraper_service_direct)
+    with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+        runs = list(ex.map(_run_buffered, tests))
+    for passed, lines in runs:
+        print("\n".join(lines))
+        if not passed: success = False
     
     # Summary
     print("\n" + "=" * 60)
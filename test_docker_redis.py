@@ -3,8 +3,7 @@
 Simple test script to generate files and test Docker + Redis integration
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
+import csv
 import json
 import os
 
@@ -15,18 +14,19 @@ data = {
     'price': [10.50, 15.75, 20.00, 18.25]
 }
 
-df = pd.DataFrame(data)
-
 # Generate CSV file
 csv_path = '/app/output/sales_data.csv'
-df.to_csv(csv_path, index=False)
+with open(csv_path, 'w', newline='') as f:
+    writer = csv.writer(f, lineterminator='\n')
+    writer.writerow(data.keys())
+    writer.writerows(zip(*data.values()))
 print(f"✅ Generated CSV: {csv_path}")
 
 # Generate JSON summary
 summary = {
-    'total_sales': df['sales'].sum(),
-    'average_price': df['price'].mean(),
-    'products': len(df)
+    'total_sales': sum(data['sales']),
+    'average_price': sum(data['price']) / len(data['price']),
+    'products': len(data['product'])
 }
 
 json_path = '/app/output/summary.json'
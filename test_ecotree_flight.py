@@ -9,8 +9,54 @@ Based on the TypeScript Playwright test script.
 import sys
 import json
 import asyncio
+import re
+from itertools import islice
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
+from scraper_patterns import (
+    ECOTREE_CO2_SELECTOR,
+    ECOTREE_RESULTS_JS,
+    SITE_SELECTORS,
+    block_unneeded_requests,
+)
+
+RESULT_LABELS = SITE_SELECTORS["ecotree.green"]["result_labels"]
+
+_NUMBER_RE = re.compile(r'[\d,.]+')
+# Fallback for pages without result cards: "X kg CO2" / "X tons CO2"
+_CO2_RE = re.compile(r'([\d,.]+)\s*(kg|tons?|tonnes?)\s*(?:of\s+)?CO2', re.IGNORECASE)
+# Only the first few "X kg CO2" hits are reported, so stop scanning there
+MAX_CO2_MATCHES = 3
+
+# Long-lived Playwright/browser shared by every calculate_flight_co2() call;
+# each call only opens a fresh context
+_pw = None
+_browser = None
+_browser_lock = None
+
+
+async def _get_browser():
+    """Launch the shared browser on first use"""
+    global _pw, _browser, _browser_lock
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    async with _browser_lock:
+        if _browser is None:
+            print("🚀 Launching browser...")
+            _pw = await async_playwright().start()
+            _browser = await _pw.chromium.launch(headless=True)
+    return _browser
+
+
+async def close_browser():
+    """Close the shared browser; call once when all lookups are done"""
+    global _pw, _browser
+    if _browser is not None:
+        await _browser.close()
+        await _pw.stop()
+        _pw = _browser = None
+        print("✅ Browser closed")
+
 
 async def calculate_flight_co2(from_city: str, to_city: str):
     """
@@ -25,109 +71,104 @@ async def calculate_flight_co2(from_city: str, to_city: str):
     """
     print(f"🌍 Calculating CO2 emissions for flight: {from_city} → {to_city}")
     
-    async with async_playwright() as p:
-        # Launch browser
-        print("🚀 Launching browser...")
-        browser = await p.chromium.launch(headless=True)
+    # Fresh context on the shared browser so cookies/storage don't carry over
+    browser = await _get_browser()
+    context = await browser.new_context()
+    await context.route('**/*', block_unneeded_requests)
+    page = await context.new_page()
+    
+    try:
+        # Step 1: Navigate to the calculator page
+        print("📍 Navigating to EcoTree calculator...")
+        await page.goto('https://ecotree.green/en/calculate-flight-co2', 
+                      wait_until="domcontentloaded", 
+                      timeout=30000)
+        print(f"✅ Page loaded: {page.url}")
+        
+        # Step 2: Click on "Plane" tab (might already be selected, but click anyway)
+        print("✈️  Selecting 'Plane' tab...")
+        try:
+            plane_link = page.get_by_role('link', name='Plane')
+            await plane_link.click(timeout=5000)
+        except Exception as e:
+            print(f"   ℹ️  Plane tab click skipped (might be default): {e}")
         
-        # Create a new page
-        page = await browser.new_page()
+        # Step 3: Fill in the "From" field
+        print(f"📝 Entering departure city: {from_city}")
+        from_textbox = page.get_by_role('textbox', name='From To Via')
+        await from_textbox.click(timeout=5000)
+        await from_textbox.fill(from_city)
         
+        # Step 4: Select the first autocomplete suggestion for departure
+        print(f"🔍 Selecting autocomplete suggestion for {from_city}...")
+        # Try to find and click the autocomplete option
+        # The text might vary, so we'll try to click any visible option containing the city
         try:
-            # Step 1: Navigate to the calculator page
-            print("📍 Navigating to EcoTree calculator...")
-            await page.goto('https://ecotree.green/en/calculate-flight-co2', 
-                          wait_until="networkidle", 
-                          timeout=30000)
-            print(f"✅ Page loaded: {page.url}")
-            
-            # Step 2: Click on "Plane" tab (might already be selected, but click anyway)
-            print("✈️  Selecting 'Plane' tab...")
-            try:
-                plane_link = page.get_by_role('link', name='Plane')
-                await plane_link.click(timeout=5000)
-                await page.wait_for_timeout(1000)  # Wait a bit for any animations
-            except Exception as e:
-                print(f"   ℹ️  Plane tab click skipped (might be default): {e}")
-            
-            # Step 3: Fill in the "From" field
-            print(f"📝 Entering departure city: {from_city}")
-            from_textbox = page.get_by_role('textbox', name='From To Via')
-            await from_textbox.click(timeout=5000)
-            await from_textbox.fill(from_city)
-            await page.wait_for_timeout(1000)  # Wait for autocomplete
-            
-            # Step 4: Select the first autocomplete suggestion for departure
-            print(f"🔍 Selecting autocomplete suggestion for {from_city}...")
-            # Try to find and click the autocomplete option
-            # The text might vary, so we'll try to click any visible option containing the city
-            try:
-                # Wait for autocomplete dropdown to appear
-                await page.wait_for_selector('text=' + from_city.capitalize(), timeout=5000)
-                # Click the first matching option (e.g., "Southampton, United Kingdom")
-                await page.locator(f'text=/.*{from_city.capitalize()}.*/i').first.click()
-                print(f"   ✅ Selected departure city")
-            except Exception as e:
-                print(f"   ⚠️  Autocomplete selection issue: {e}")
-                # Try alternative approach - just press Enter
-                await from_textbox.press('Enter')
-            
-            await page.wait_for_timeout(1000)
-            
-            # Step 5: Fill in the "To" field
-            print(f"📝 Entering destination city: {to_city}")
-            to_input = page.locator('input[name="To"]')
-            await to_input.click(timeout=5000)
-            await to_input.fill(to_city)
-            await page.wait_for_timeout(1000)  # Wait for autocomplete
-            
-            # Step 6: Select the first autocomplete suggestion for destination
-            print(f"🔍 Selecting autocomplete suggestion for {to_city}...")
-            try:
-                # Wait for autocomplete dropdown
-                await page.wait_for_selector('text=' + to_city.capitalize(), timeout=5000)
-                # Click the matching option
-                await page.locator(f'text=/.*{to_city.capitalize()}.*/i').first.click()
-                print(f"   ✅ Selected destination city")
-            except Exception as e:
-                print(f"   ⚠️  Autocomplete selection issue: {e}")
-                # Try alternative approach
-                await to_input.press('Enter')
-            
-            await page.wait_for_timeout(1000)
-            
-            # Step 7: Click the "Calculate my emissions" button
-            print("🧮 Clicking calculate button...")
-            calculate_button = page.get_by_role('link', name='Calculate my emissions')
-            await calculate_button.click(timeout=5000)
-            
-            # Wait for results to load
-            print("⏳ Waiting for results...")
-            await page.wait_for_load_state("networkidle", timeout=15000)
-            await page.wait_for_timeout(2000)  # Extra wait for any animations
-            
-            # Step 8: Extract the results
-            print("📊 Extracting CO2 emissions data...")
-            
-            # Take a screenshot for debugging
-            await page.screenshot(path="/tmp/ecotree_results.png")
-            print("📸 Screenshot saved to /tmp/ecotree_results.png")
-            
-            # Extract page content to find CO2 values
-            page_content = await page.content()
-            
-            # Try to extract specific CO2 values from the page
-            # The exact selectors may vary based on the page structure
-            co2_data = {}
+            # Wait for autocomplete dropdown to appear
+            await page.wait_for_selector('text=' + from_city.capitalize(), timeout=5000)
+            # Click the first matching option (e.g., "Southampton, United Kingdom")
+            await page.locator(f'text=/.*{from_city.capitalize()}.*/i').first.click()
+            print(f"   ✅ Selected departure city")
+        except Exception as e:
+            print(f"   ⚠️  Autocomplete selection issue: {e}")
+            # Try alternative approach - just press Enter
+            await from_textbox.press('Enter')
+        
+        # Step 5: Fill in the "To" field
+        print(f"📝 Entering destination city: {to_city}")
+        to_input = page.locator('input[name="To"]')
+        await to_input.click(timeout=5000)
+        await to_input.fill(to_city)
+        
+        # Step 6: Select the first autocomplete suggestion for destination
+        print(f"🔍 Selecting autocomplete suggestion for {to_city}...")
+        try:
+            # Wait for autocomplete dropdown
+            await page.wait_for_selector('text=' + to_city.capitalize(), timeout=5000)
+            # Click the matching option
+            await page.locator(f'text=/.*{to_city.capitalize()}.*/i').first.click()
+            print(f"   ✅ Selected destination city")
+        except Exception as e:
+            print(f"   ⚠️  Autocomplete selection issue: {e}")
+            # Try alternative approach
+            await to_input.press('Enter')
+        
+        # Step 7: Click the "Calculate my emissions" button
+        print("🧮 Clicking calculate button...")
+        calculate_button = page.get_by_role('link', name='Calculate my emissions')
+        await calculate_button.click(timeout=5000)
+        
+        # Wait for the result card, or any "N kg" text so the text fallback
+        # below still runs when the card selector misses
+        print("⏳ Waiting for results...")
+        await page.locator(ECOTREE_CO2_SELECTOR).or_(page.locator('text=/\\d+\\s*kg/')).first.wait_for(timeout=15000)
+        
+        # Step 8: Extract the results
+        print("📊 Extracting CO2 emissions data...")
+        
+        # Take a screenshot for debugging
+        await page.screenshot(path="/tmp/ecotree_results.png")
+        print("📸 Screenshot saved to /tmp/ecotree_results.png")
+        
+        # Read the result card values, or the first kg/km figures, in one round-trip
+        co2_data = {}
+        
+        try:
+            cards = await page.evaluate(ECOTREE_RESULTS_JS, RESULT_LABELS)
+            for text, key in zip(cards, ("co2_kg", "distance_km")):
+                number = _NUMBER_RE.search(text or "")
+                if number:
+                    co2_data[key] = number.group(0)
             
-            try:
-                # Try to find CO2 emission text on the page
-                # Look for text patterns like "X kg CO2" or "X tons CO2"
+            if "co2_kg" in co2_data:
+                print(f"   ✅ Found CO2 value: {co2_data['co2_kg']} kg")
+            else:
+                # Fall back to scanning the page text for "X kg CO2" patterns
                 text_content = await page.evaluate("() => document.body.innerText")
-                
-                # Parse for CO2 values (this is a simple approach)
-                import re
-                co2_matches = re.findall(r'([\d,.]+)\s*(kg|tons?|tonnes?)\s*(?:of\s+)?CO2', text_content, re.IGNORECASE)
+                co2_matches = [
+                    m.groups()
+                    for m in islice(_CO2_RE.finditer(text_content), MAX_CO2_MATCHES)
+                ]
                 
                 if co2_matches:
                     co2_data['co2_emissions'] = co2_matches
@@ -135,47 +176,72 @@ async def calculate_flight_co2(from_city: str, to_city: str):
                 
                 # Store full text for analysis
                 co2_data['page_text'] = text_content[:1000]  # First 1000 chars
-                
-            except Exception as e:
-                print(f"   ⚠️  Error extracting CO2 data: {e}")
             
-            # Get page title and URL
-            title = await page.title()
-            final_url = page.url
-            
-            result = {
-                "success": True,
-                "from_city": from_city,
-                "to_city": to_city,
-                "title": title,
-                "url": final_url,
-                "co2_data": co2_data,
-            }
-            
-            return result
-            
-        except PlaywrightTimeoutError as e:
-            print(f"⏱️ Timeout Error: {e}")
-            return {
-                "success": False,
-                "error": f"Timeout: {e}",
-                "from_city": from_city,
-                "to_city": to_city,
-            }
         except Exception as e:
-            print(f"❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
-            return {
-                "success": False,
-                "error": str(e),
-                "from_city": from_city,
-                "to_city": to_city,
-            }
-        finally:
-            await page.close()
-            await browser.close()
-            print("✅ Browser closed")
+            print(f"   ⚠️  Error extracting CO2 data: {e}")
+        
+        # Get page title and URL
+        title = await page.title()
+        final_url = page.url
+        
+        result = {
+            "success": True,
+            "from_city": from_city,
+            "to_city": to_city,
+            "title": title,
+            "url": final_url,
+            "co2_data": co2_data,
+        }
+        
+        return result
+        
+    except PlaywrightTimeoutError as e:
+        print(f"⏱️ Timeout Error: {e}")
+        return {
+            "success": False,
+            "error": f"Timeout: {e}",
+            "from_city": from_city,
+            "to_city": to_city,
+        }
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return {
+            "success": False,
+            "error": str(e),
+            "from_city": from_city,
+            "to_city": to_city,
+        }
+    finally:
+        await context.close()
+
+
+async def calculate_many(routes, max_concurrency=4):
+    """
+    Calculate emissions for several routes concurrently on the shared browser
+    
+    Args:
+        routes: Iterable of (from_city, to_city) pairs
+        max_concurrency: Maximum number of lookups in flight at once
+    
+    Returns:
+        list: One calculate_flight_co2 result dict per route, in order
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+    
+    async def one(route):
+        async with sem:
+            return await calculate_flight_co2(*route)
+    
+    return await asyncio.gather(*(one(route) for route in routes))
+
+
+async def _run(from_city, to_city):
+    try:
+        return await calculate_flight_co2(from_city, to_city)
+    finally:
+        await close_browser()
 
 
 def main():
@@ -196,7 +262,7 @@ def main():
     print(f"\n📍 Route: {from_city.upper()} → {to_city.upper()}\n")
     
     # Run the calculation
-    result = asyncio.run(calculate_flight_co2(from_city, to_city))
+    result = asyncio.run(_run(from_city, to_city))
     
     # Print final result
     print("\n" + "=" * 60)
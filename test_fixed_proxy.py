@@ -4,7 +4,12 @@ Test the FIXED proxy on port 11434 with /v1/chat/completions endpoint
 This mimics how HDN would call the LLM for code generation
 """
 import requests
-import json
+
+from _fastjson import dumps, loads, pretty
+from _http_session import new_session
+
+# Only failed connects are retried; see _http_session
+_SESSION = new_session(connect_retries=3)
 
 # Test the FIXED proxy (should be running on port 11434)
 PROXY_URL = "http://192.168.1.60:11434/v1/chat/completions"
@@ -37,12 +42,12 @@ payload = {
 }
 
 print("🚀 Sending request...")
-print(f"📦 Payload: {json.dumps(payload, indent=2)}\n")
+print(f"📦 Payload: {pretty(payload)}\n")
 
 try:
-    response = requests.post(
+    response = _SESSION.post(
         PROXY_URL,
-        json=payload,
+        data=dumps(payload),
         headers={"Content-Type": "application/json"},
         timeout=300  # 5 minutes for TPU
     )
@@ -50,10 +55,10 @@ try:
     print(f"📊 Status Code: {response.status_code}\n")
     
     if response.status_code == 200:
-        data = response.json()
+        data = loads(response.content)
         print("✅ SUCCESS - Response received!")
         print("="*70)
-        print(json.dumps(data, indent=2))
+        print(pretty(data))
         print("="*70)
         
         # Extract generated code
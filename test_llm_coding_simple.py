@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Simple test to check LLM proxy code generation - mimics HDN requests"""
 
-import requests
-import json
+import asyncio
+import httpx
+
+from _fastjson import dumps, loads, pretty
 
 # Config from your llm-config-secret.yaml
 BASE_URL = "http://192.168.1.60:11434"
@@ -17,18 +19,18 @@ PROMPT = """You are an expert programmer. Write a Python function that:
 
 Respond with ONLY the code, no explanations."""
 
-def test_endpoint(url, payload):
+async def test_endpoint(client, url, payload):
     """Test a specific endpoint"""
     print(f"\n{'='*60}")
     print(f"Testing: {url}")
     print(f"{'='*60}")
     try:
-        resp = requests.post(url, json=payload, timeout=60)
+        resp = await client.post(url, content=dumps(payload), headers={"Content-Type": "application/json"})
         print(f"Status: {resp.status_code}")
         if resp.status_code == 200:
-            data = resp.json()
+            data = loads(resp.content)
             print(f"✅ SUCCESS!")
-            print(json.dumps(data, indent=2))
+            print(pretty(data))
             return True
         else:
             print(f"❌ Error: {resp.text[:200]}")
@@ -37,32 +39,47 @@ def test_endpoint(url, payload):
     return False
 
 # Test 1: Ollama /api/generate format (used by wiki-summarizer)
-print("\n🧪 Test 1: /api/generate endpoint")
 payload1 = {
     "model": MODEL,
     "prompt": PROMPT,
     "stream": False
 }
-test_endpoint(f"{BASE_URL}/api/generate", payload1)
 
 # Test 2: Ollama /api/chat format (used by HDN)
-print("\n🧪 Test 2: /api/chat endpoint")
 payload2 = {
     "model": MODEL,
     "messages": [{"role": "user", "content": PROMPT}],
     "stream": False
 }
-test_endpoint(f"{BASE_URL}/api/chat", payload2)
 
 # Test 3: OpenAI-compatible format
-print("\n🧪 Test 3: /v1/chat/completions endpoint")
 payload3 = {
     "model": MODEL,
     "messages": [{"role": "user", "content": PROMPT}],
     "temperature": 0.7,
     "max_tokens": 1000
 }
-test_endpoint(f"{BASE_URL}/v1/chat/completions", payload3)
 
-print("\n" + "="*60)
-print("Tests complete!")
+TESTS = [
+    ("🧪 Test 1: /api/generate endpoint", f"{BASE_URL}/api/generate", payload1),
+    ("🧪 Test 2: /api/chat endpoint", f"{BASE_URL}/api/chat", payload2),
+    ("🧪 Test 3: /v1/chat/completions endpoint", f"{BASE_URL}/v1/chat/completions", payload3),
+]
+
+async def main():
+    # One pooled client, one request at a time: the TPU proxy serves a single
+    # request at once (60-120 s each), so concurrent requests would queue
+    # behind each other and hit their timeouts
+    async with httpx.AsyncClient(
+        timeout=60,
+        transport=httpx.AsyncHTTPTransport(retries=3),
+    ) as client:
+        for title, url, payload in TESTS:
+            print(f"\n{title}")
+            await test_endpoint(client, url, payload)
+
+    print("\n" + "="*60)
+    print("Tests complete!")
+
+if __name__ == "__main__":
+    asyncio.run(main())
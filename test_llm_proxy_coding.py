@@ -4,10 +4,12 @@ Test script to send a code generation request to the LLM proxy,
 mimicking how HDN would request code generation.
 """
 
-import requests
-import json
+import asyncio
+import httpx
 import sys
 
+from _fastjson import dumps, loads, pretty
+
 # Configuration - adjust these to match your setup
 PROXY_BASE = "http://192.168.1.60:11434"  # From your llm-config-secret.yaml
 MODEL_NAME = "qwen2.5-1.5b-instruct"  # Adjust to your actual model name
@@ -18,8 +20,10 @@ ENDPOINTS = {
     "generate": f"{PROXY_BASE}/api/generate",
     "openai": f"{PROXY_BASE}/v1/chat/completions"
 }
+# Both tests send the Ollama chat format
+PROXY_URL = ENDPOINTS["chat"]
 
-def test_code_generation():
+async def test_code_generation(client):
     """
     Send a code generation request similar to how HDN's IntelligentExecutor would.
     This mimics the request format from intelligent_executor.go
@@ -61,9 +65,9 @@ Respond with ONLY the Python code, no explanations."""
     print("🚀 Sending request...\n")
     
     try:
-        response = requests.post(
+        response = await client.post(
             PROXY_URL,
-            json=request_payload,
+            content=dumps(request_payload),
             headers={"Content-Type": "application/json"},
             timeout=120  # 2 minute timeout like HDN uses
         )
@@ -72,10 +76,10 @@ Respond with ONLY the Python code, no explanations."""
         print(f"📊 Response Headers: {dict(response.headers)}\n")
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = loads(response.content)
             print("✅ SUCCESS - Response received:")
             print("=" * 80)
-            print(json.dumps(response_data, indent=2))
+            print(pretty(response_data))
             print("=" * 80)
             
             # Extract the generated code (Ollama format)
@@ -94,10 +98,10 @@ Respond with ONLY the Python code, no explanations."""
             print(f"Response: {response.text}")
             return False
             
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print("❌ TIMEOUT - Request took longer than 120 seconds")
         return False
-    except requests.exceptions.ConnectionError as e:
+    except httpx.ConnectError as e:
         print(f"❌ CONNECTION ERROR - Could not connect to {PROXY_URL}")
         print(f"Error: {e}")
         return False
@@ -105,7 +109,7 @@ Respond with ONLY the Python code, no explanations."""
         print(f"❌ ERROR - {type(e).__name__}: {e}")
         return False
 
-def test_simple_chat():
+async def test_simple_chat(client):
     """
     Send a simple chat request to verify basic connectivity.
     """
@@ -129,15 +133,15 @@ def test_simple_chat():
     print("🚀 Sending request...\n")
     
     try:
-        response = requests.post(
+        response = await client.post(
             PROXY_URL,
-            json=request_payload,
+            content=dumps(request_payload),
             headers={"Content-Type": "application/json"},
             timeout=60
         )
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = loads(response.content)
             if "message" in response_data and "content" in response_data["message"]:
                 print("✅ Response:", response_data["message"]["content"])
                 return True
@@ -149,19 +153,28 @@ def test_simple_chat():
         print(f"❌ Error: {e}")
         return False
 
+async def main():
+    # The TPU proxy serves one request at a time and takes 60-120 s each, so
+    # the tests run one after the other; the cheap chat check gates the
+    # expensive code generation request
+    async with httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(retries=3),
+    ) as client:
+        # Test 1: Simple chat
+        if not await test_simple_chat(client):
+            print("\n⚠️  Simple chat test failed. Check your proxy configuration.")
+            return 1
+        
+        # Test 2: Code generation
+        if await test_code_generation(client):
+            print("\n✅ All tests passed! Your LLM proxy is working correctly for code generation.")
+            return 0
+        else:
+            print("\n❌ Code generation test failed.")
+            return 1
+
 if __name__ == "__main__":
     print("\n🔬 LLM Proxy Test Suite")
     print("This script mimics how HDN would request code generation from the LLM\n")
     
-    # Test 1: Simple chat
-    if not test_simple_chat():
-        print("\n⚠️  Simple chat test failed. Check your proxy configuration.")
-        sys.exit(1)
-    
-    # Test 2: Code generation
-    if test_code_generation():
-        print("\n✅ All tests passed! Your LLM proxy is working correctly for code generation.")
-        sys.exit(0)
-    else:
-        print("\n❌ Code generation test failed.")
-        sys.exit(1)
+    sys.exit(asyncio.run(main()))
@@ -10,174 +10,166 @@ Requirements:
     playwright install chromium
 """
 
+import os
 import sys
 import json
 import asyncio
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
+# Cookies saved after a successful interactive run, so later runs skip
+# Google's consent redirects
+GOOGLE_STATE_PATH = "/tmp/pw_google.json"
 
-async def test_basic_navigation(url: str = "https://example.com"):
+
+async def test_basic_navigation(context, url: str = "https://example.com"):
     """Test basic page navigation and content extraction"""
     print(f"🌐 Testing basic navigation to {url}")
     
-    async with async_playwright() as p:
-        # Launch browser
-        print("🚀 Launching Chromium browser...")
-        browser = await p.chromium.launch(headless=True)
+    page = await context.new_page()
+    
+    try:
+        # Navigate to URL
+        print(f"📍 Navigating to {url}")
+        await page.goto(url, wait_until="networkidle", timeout=30000)
         
-        # Create a new page
-        page = await browser.new_page()
+        # Get page title
+        title = await page.title()
+        print(f"📄 Page Title: {title}")
         
-        try:
-            # Navigate to URL
-            print(f"📍 Navigating to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            # Get page title
-            title = await page.title()
-            print(f"📄 Page Title: {title}")
-            
-            # Get page content
-            content = await page.content()
-            print(f"📝 Page Content Length: {len(content)} characters")
-            
-            # Extract text content
-            text_content = await page.evaluate("() => document.body.innerText")
-            print(f"📃 Text Content (first 200 chars):\n{text_content[:200]}...")
-            
-            # Take a screenshot
-            await page.screenshot(path="/tmp/playwright_test_screenshot.png")
-            print("📸 Screenshot saved to /tmp/playwright_test_screenshot.png")
-            
-            result = {
-                "success": True,
-                "url": page.url,
-                "title": title,
-                "content_length": len(content),
-                "text_length": len(text_content),
-            }
-            
-            return result
-            
-        except PlaywrightTimeoutError as e:
-            print(f"⏱️ Timeout Error: {e}")
-            return {"success": False, "error": f"Timeout: {e}"}
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return {"success": False, "error": str(e)}
-        finally:
-            await page.close()
-            await browser.close()
-            print("✅ Browser closed")
+        # Get page content
+        content = await page.content()
+        print(f"📝 Page Content Length: {len(content)} characters")
+        
+        # Extract text content
+        text_content = await page.evaluate("() => document.body.innerText")
+        print(f"📃 Text Content (first 200 chars):\n{text_content[:200]}...")
+        
+        # Take a screenshot
+        await page.screenshot(path="/tmp/playwright_test_screenshot.png")
+        print("📸 Screenshot saved to /tmp/playwright_test_screenshot.png")
+        
+        result = {
+            "success": True,
+            "url": page.url,
+            "title": title,
+            "content_length": len(content),
+            "text_length": len(text_content),
+        }
+        
+        return result
+        
+    except PlaywrightTimeoutError as e:
+        print(f"⏱️ Timeout Error: {e}")
+        return {"success": False, "error": f"Timeout: {e}"}
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        await page.close()
 
 
-async def test_interactive_actions(url: str = "https://www.google.com"):
+async def test_interactive_actions(context, url: str = "https://www.google.com"):
     """Test interactive browser actions like clicking and filling forms"""
     print(f"\n🎯 Testing interactive actions on {url}")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    page = await context.new_page()
+    
+    try:
+        # Navigate
+        print(f"📍 Navigating to {url}")
+        await page.goto(url, wait_until="networkidle", timeout=30000)
         
-        try:
-            # Navigate
-            print(f"📍 Navigating to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=30000)
+        # Wait for search box (Google's search input)
+        print("🔍 Looking for search input...")
+        search_input = await page.query_selector('input[name="q"], textarea[name="q"]')
+        
+        if search_input:
+            print("✅ Found search input")
             
-            # Wait for search box (Google's search input)
-            print("🔍 Looking for search input...")
-            search_input = await page.query_selector('input[name="q"], textarea[name="q"]')
+            # Fill the search box
+            await search_input.fill("Playwright Python")
+            print("⌨️ Filled search box with 'Playwright Python'")
             
-            if search_input:
-                print("✅ Found search input")
-                
-                # Fill the search box
-                await search_input.fill("Playwright Python")
-                print("⌨️ Filled search box with 'Playwright Python'")
-                
-                # Press Enter to search
-                await search_input.press("Enter")
-                print("↩️ Pressed Enter")
-                
-                # Wait for navigation
-                await page.wait_for_load_state("networkidle", timeout=10000)
-                
-                # Get new page title
-                title = await page.title()
-                print(f"📄 New Page Title: {title}")
-                
-                result = {
-                    "success": True,
-                    "action": "search",
-                    "title": title,
-                    "url": page.url,
-                }
-            else:
-                print("⚠️ Search input not found")
-                result = {
-                    "success": False,
-                    "error": "Search input not found"
-                }
+            # Press Enter to search
+            await search_input.press("Enter")
+            print("↩️ Pressed Enter")
             
-            return result
+            # Wait for navigation
+            await page.wait_for_load_state("networkidle", timeout=10000)
             
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return {"success": False, "error": str(e)}
-        finally:
-            await page.close()
-            await browser.close()
-            print("✅ Browser closed")
+            # Get new page title
+            title = await page.title()
+            print(f"📄 New Page Title: {title}")
+            
+            # Keep the consent cookies for the next run
+            await context.storage_state(path=GOOGLE_STATE_PATH)
+            
+            result = {
+                "success": True,
+                "action": "search",
+                "title": title,
+                "url": page.url,
+            }
+        else:
+            print("⚠️ Search input not found")
+            result = {
+                "success": False,
+                "error": "Search input not found"
+            }
+        
+        return result
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        await page.close()
 
 
-async def test_complex_selectors(url: str = "https://news.ycombinator.com"):
+async def test_complex_selectors(context, url: str = "https://news.ycombinator.com"):
     """Test complex CSS selectors and data extraction"""
     print(f"\n🎨 Testing complex selectors on {url}")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    page = await context.new_page()
+    
+    try:
+        # Navigate
+        print(f"📍 Navigating to {url}")
+        await page.goto(url, wait_until="networkidle", timeout=30000)
         
-        try:
-            # Navigate
-            print(f"📍 Navigating to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            # Extract news titles
-            print("📰 Extracting news titles...")
-            titles = await page.evaluate("""
-                () => {
-                    const titleElements = document.querySelectorAll('.titleline > a');
-                    return Array.from(titleElements).slice(0, 5).map(el => ({
-                        text: el.innerText,
-                        href: el.href
-                    }));
-                }
-            """)
-            
-            print(f"✅ Found {len(titles)} news items:")
-            for i, item in enumerate(titles, 1):
-                print(f"  {i}. {item['text']}")
-                print(f"     → {item['href']}")
-            
-            result = {
-                "success": True,
-                "items_found": len(titles),
-                "items": titles,
+        # Extract news titles
+        print("📰 Extracting news titles...")
+        titles = await page.evaluate("""
+            () => {
+                const titleElements = document.querySelectorAll('.titleline > a');
+                return Array.from(titleElements).slice(0, 5).map(el => ({
+                    text: el.innerText,
+                    href: el.href
+                }));
             }
-            
-            return result
-            
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return {"success": False, "error": str(e)}
-        finally:
-            await page.close()
-            await browser.close()
-            print("✅ Browser closed")
+        """)
+        
+        print(f"✅ Found {len(titles)} news items:")
+        for i, item in enumerate(titles, 1):
+            print(f"  {i}. {item['text']}")
+            print(f"     → {item['href']}")
+        
+        result = {
+            "success": True,
+            "items_found": len(titles),
+            "items": titles,
+        }
+        
+        return result
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        await page.close()
 
 
-async def test_custom_url_with_config(url: str, operations: list):
+async def test_custom_url_with_config(context, url: str, operations: list):
     """
     Test custom URL with Playwright operations
     
@@ -194,85 +186,125 @@ async def test_custom_url_with_config(url: str, operations: list):
     """
     print(f"\n🔧 Testing custom operations on {url}")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        extracted_data = {}
+    page = await context.new_page()
+    
+    extracted_data = {}
+    
+    try:
+        # Navigate to initial URL
+        await page.goto(url, wait_until="networkidle", timeout=30000)
+        print(f"✅ Navigated to {url}")
         
-        try:
-            # Navigate to initial URL
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            print(f"✅ Navigated to {url}")
+        # Execute operations
+        for i, op in enumerate(operations, 1):
+            op_type = op.get("type")
+            print(f"  [{i}] Executing: {op_type}")
             
-            # Execute operations
-            for i, op in enumerate(operations, 1):
-                op_type = op.get("type")
-                print(f"  [{i}] Executing: {op_type}")
+            if op_type == "goto":
+                target_url = op.get("url", url)
+                await page.goto(target_url, wait_until="networkidle")
+                print(f"      → Navigated to {target_url}")
                 
-                if op_type == "goto":
-                    target_url = op.get("url", url)
-                    await page.goto(target_url, wait_until="networkidle")
-                    print(f"      → Navigated to {target_url}")
-                    
-                elif op_type == "click":
-                    selector = op.get("selector")
-                    await page.click(selector, timeout=5000)
-                    print(f"      → Clicked {selector}")
-                    
-                elif op_type == "fill":
-                    selector = op.get("selector")
-                    value = op.get("value")
-                    await page.fill(selector, value, timeout=5000)
-                    print(f"      → Filled {selector} with '{value}'")
-                    
-                elif op_type == "wait":
-                    selector = op.get("selector")
-                    timeout = op.get("timeout", 5000)
-                    await page.wait_for_selector(selector, timeout=timeout)
-                    print(f"      → Waited for {selector}")
-                    
-                elif op_type == "extract":
-                    selector = op.get("selector")
-                    attribute = op.get("attribute", "innerText")
-                    key = op.get("key", f"extracted_{i}")
-                    
-                    if attribute == "innerText":
-                        value = await page.evaluate(f"document.querySelector('{selector}')?.innerText")
-                    elif attribute == "innerHTML":
-                        value = await page.evaluate(f"document.querySelector('{selector}')?.innerHTML")
-                    else:
-                        value = await page.get_attribute(selector, attribute)
-                    
-                    extracted_data[key] = value
-                    print(f"      → Extracted {key}: {str(value)[:100]}")
-            
-            # Get final page state
-            title = await page.title()
-            final_url = page.url
-            
-            result = {
-                "success": True,
-                "title": title,
-                "url": final_url,
-                "extracted": extracted_data,
-            }
-            
-            return result
-            
-        except Exception as e:
-            print(f"❌ Error during operation: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "extracted": extracted_data,
-            }
+            elif op_type == "click":
+                selector = op.get("selector")
+                await page.click(selector, timeout=5000)
+                print(f"      → Clicked {selector}")
+                
+            elif op_type == "fill":
+                selector = op.get("selector")
+                value = op.get("value")
+                await page.fill(selector, value, timeout=5000)
+                print(f"      → Filled {selector} with '{value}'")
+                
+            elif op_type == "wait":
+                selector = op.get("selector")
+                timeout = op.get("timeout", 5000)
+                await page.wait_for_selector(selector, timeout=timeout)
+                print(f"      → Waited for {selector}")
+                
+            elif op_type == "extract":
+                selector = op.get("selector")
+                attribute = op.get("attribute", "innerText")
+                key = op.get("key", f"extracted_{i}")
+                
+                if attribute == "innerText":
+                    value = await page.evaluate(f"document.querySelector('{selector}')?.innerText")
+                elif attribute == "innerHTML":
+                    value = await page.evaluate(f"document.querySelector('{selector}')?.innerHTML")
+                else:
+                    value = await page.get_attribute(selector, attribute)
+                
+                extracted_data[key] = value
+                print(f"      → Extracted {key}: {str(value)[:100]}")
+        
+        # Get final page state
+        title = await page.title()
+        final_url = page.url
+        
+        result = {
+            "success": True,
+            "title": title,
+            "url": final_url,
+            "extracted": extracted_data,
+        }
+        
+        return result
+        
+    except Exception as e:
+        print(f"❌ Error during operation: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "extracted": extracted_data,
+        }
+    finally:
+        await page.close()
+
+
+async def new_context(browser, test):
+    """Open a context for test, warm-started from saved cookies where available"""
+    if test is test_interactive_actions and os.path.exists(GOOGLE_STATE_PATH):
+        return await browser.new_context(storage_state=GOOGLE_STATE_PATH)
+    return await browser.new_context()
+
+
+async def with_browser(run):
+    """Launch Chromium once, await run(browser), then shut it down"""
+    async with async_playwright() as p:
+        print("🚀 Launching Chromium browser...")
+        browser = await p.chromium.launch(headless=True)
+        try:
+            return await run(browser)
         finally:
-            await page.close()
             await browser.close()
             print("✅ Browser closed")
 
 
+async def run_test(test, *args):
+    """Run a single test(context, *args) in a fresh context"""
+    async def run(browser):
+        context = await new_context(browser, test)
+        try:
+            return await test(context, *args)
+        finally:
+            await context.close()
+    return await with_browser(run)
+
+
+async def run_all_tests():
+    """Run the three built-in tests concurrently on one browser, one context each"""
+    tests = (test_basic_navigation, test_interactive_actions, test_complex_selectors)
+
+    async def run(browser):
+        contexts = await asyncio.gather(*(new_context(browser, test) for test in tests))
+        try:
+            # Network waits in each context overlap instead of serializing
+            return await asyncio.gather(*(test(ctx) for test, ctx in zip(tests, contexts)))
+        finally:
+            await asyncio.gather(*(ctx.close() for ctx in contexts))
+    return await with_browser(run)
+
+
 def main():
     """Main entry point"""
     print("=" * 60)
@@ -285,15 +317,15 @@ def main():
         
         if command == "basic":
             url = sys.argv[2] if len(sys.argv) > 2 else "https://example.com"
-            result = asyncio.run(test_basic_navigation(url))
+            result = asyncio.run(run_test(test_basic_navigation, url))
             
         elif command == "interactive":
             url = sys.argv[2] if len(sys.argv) > 2 else "https://www.google.com"
-            result = asyncio.run(test_interactive_actions(url))
+            result = asyncio.run(run_test(test_interactive_actions, url))
             
         elif command == "selectors":
             url = sys.argv[2] if len(sys.argv) > 2 else "https://news.ycombinator.com"
-            result = asyncio.run(test_complex_selectors(url))
+            result = asyncio.run(run_test(test_complex_selectors, url))
             
         elif command == "custom":
             if len(sys.argv) < 4:
@@ -304,7 +336,7 @@ def main():
             
             url = sys.argv[2]
             operations = json.loads(sys.argv[3])
-            result = asyncio.run(test_custom_url_with_config(url, operations))
+            result = asyncio.run(run_test(test_custom_url_with_config, url, operations))
             
         else:
             print(f"Unknown command: {command}")
@@ -314,9 +346,7 @@ def main():
         # Run all tests
         print("\n🧪 Running all tests...\n")
         
-        result1 = asyncio.run(test_basic_navigation())
-        result2 = asyncio.run(test_interactive_actions())
-        result3 = asyncio.run(test_complex_selectors())
+        result1, result2, result3 = asyncio.run(run_all_tests())
         
         result = {
             "basic_navigation": result1,
@@ -4,6 +4,12 @@
 import requests
 import json
 
+from _fastjson import dumps, loads, pretty
+from _http_session import new_session
+
+# Only failed connects are retried; see _http_session
+_SESSION = new_session(connect_retries=3)
+
 # CORRECTED: Your proxy is on port 8000, not 11434!
 BASE_URL = "http://192.168.1.60:8000"
 MODEL = "qwen2.5-1.5b-instruct"
@@ -26,12 +32,12 @@ payload = {
 }
 
 print("🚀 Sending request...")
-print(f"📦 Payload: {json.dumps(payload, indent=2)}\n")
+print(f"📦 Payload: {pretty(payload)}\n")
 
 try:
-    response = requests.post(
+    response = _SESSION.post(
         f"{BASE_URL}/api/generate",
-        json=payload,
+        data=dumps(payload),
         headers={"Content-Type": "application/json"},
         timeout=120
     )
@@ -46,9 +52,9 @@ try:
         print("="*70)
         
         try:
-            data = response.json()
+            data = loads(response.content)
             print("\n📋 Parsed JSON:")
-            print(json.dumps(data, indent=2))
+            print(pretty(data))
             
             # Try to extract the response text
             if "response" in data:
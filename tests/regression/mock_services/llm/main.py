@@ -1,20 +1,99 @@
-from flask import Flask, request, jsonify
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from collections import OrderedDict
+import hashlib
+import orjson
+import re
 import time
 import os
 
-app = Flask(__name__)
+app = FastAPI()
+
+# orjson (installed in the image) encodes and parses several times faster
+_dumps = orjson.dumps
+_loads = orjson.loads
+
+def _json_response(obj):
+    return Response(_dumps(obj), media_type='application/json')
+
+# Replies are deterministic per prompt, so repeated prompts from the regression
+# suites are served from an LRU keyed by a digest (the prompts themselves,
+# which can be whole scraped pages, are not kept)
+CACHE_SIZE = 1024
+_cache = OrderedDict()
+
+def _digest(text):
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+def _cached(key, compute, *args):
+    # Handlers run on each worker's event loop, so no lock is needed
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+    value = compute(*args)
+    _cache[key] = value
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return value
+
+# Every keyword the reply ladders below test for. One regex pass finds them
+# all instead of a separate substring scan per keyword: the lookahead reports
+# the longest keyword starting at each position, and _IMPLIED adds the shorter
+# keywords contained in it (e.g. "scraper" inside "scraper_agent")
+_KEYWORDS = (
+    "calculate the",
+    "category",
+    "classify",
+    "configure",
+    "domain",
+    "example",
+    "experiment",
+    "experiment ideas",
+    "extract entities",
+    "find",
+    "generate",
+    "generate 1 to 3",
+    "iran",
+    "json array of tool calls",
+    "my name is",
+    "news",
+    "plan",
+    "python code",
+    "remember",
+    "return as json",
+    "scraper",
+    "scraper_agent",
+    "scraping",
+    "summarize",
+    "title",
+    "write",
+)
+_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(k) for k in sorted(_KEYWORDS, key=len, reverse=True)) + '))'
+)
+_IMPLIED = {k: frozenset(j for j in _KEYWORDS if j in k) for k in _KEYWORDS}
+
+def _keywords(lower_msg):
+    """Return the set of _KEYWORDS that occur in lower_msg"""
+    found = set()
+    for m in _KEYWORD_RE.finditer(lower_msg):
+        found |= _IMPLIED[m.group(1)]
+    return found
 
 def get_smart_response(msg):
-    lower_msg = msg.lower()
+    return _cached(("smart", _digest(msg)), _smart_response, msg)
+
+def _smart_response(msg):
+    found = _keywords(msg.lower())
     
     # 1. SPECIFIC SUCCESS CASES (Highest Priority)
     # This must come first to avoid being caught by generic keyword matches below
-    if ("example" in lower_msg and "domain" in lower_msg) and ("title" in lower_msg or "find" in lower_msg):
+    if ("example" in found and "domain" in found) and ("title" in found or "find" in found):
         return "Example Domain"
         
     # 2. HYPOTHESIS GENERATION / AGENT PLANNING
     # Prompts that ask for 1 to 3 experiment ideas
-    if "generate 1 to 3" in lower_msg or "experiment ideas" in lower_msg or "json array of tool calls" in lower_msg or "scraper_agent" in lower_msg:
+    if "generate 1 to 3" in found or "experiment ideas" in found or "json array of tool calls" in found or "scraper_agent" in found:
         return """[
   {
     "description": "If we scrape the example.com domain, we will find the title is Example Domain.",
@@ -24,7 +103,7 @@ def get_smart_response(msg):
     
     # 3. CODE GENERATION
     # Only trigger if specifically asked for code or calculations
-    if ("write" in lower_msg or "generate" in lower_msg) and ("python code" in lower_msg or "calculate the" in lower_msg):
+    if ("write" in found or "generate" in found) and ("python code" in found or "calculate the" in found):
         return """Here is the Python code:
 ```python
 print('Hello from Mock LLM Code Gen')
@@ -34,7 +113,7 @@ print(f'Result: {x}')
     
     # 4. SCRAPER CONFIGURATION PLANNING
     # Only if asked to plan or configure a scraper
-    if ("plan" in lower_msg or "configure" in lower_msg) and ("scraper" in lower_msg or "scraping" in lower_msg):
+    if ("plan" in found or "configure" in found) and ("scraper" in found or "scraping" in found):
         return """```json
 {
   "typescript_config": "",
@@ -47,62 +126,61 @@ print(f'Result: {x}')
     return f"Mock response to: {msg[:20]}... [Processed by Mock LLM]"
 
 
-@app.route('/health', methods=['GET'])
-def health():
-    return jsonify({"status": "healthy"})
+@app.get('/health')
+async def health():
+    return _json_response({"status": "healthy"})
+
+@app.get('/goals/{agent_id}/active')
+async def get_active_goals(agent_id: str):
+    return _json_response([])
 
-@app.route('/goals/<agent_id>/active', methods=['GET'])
-def get_active_goals(agent_id):
-    return jsonify([])
+# Only "created" and the content vary between completions, so the rest of the
+# body is serialized once here
+_COMPLETION_TEMPLATE = (
+    b'{"id":"chatcmpl-mock","object":"chat.completion","created":%d,'
+    b'"choices":[{"index":0,"message":{"role":"assistant","content":%s},"finish_reason":"stop"}],'
+    b'"usage":{"prompt_tokens":10,"completion_tokens":10,"total_tokens":20}}'
+)
 
 # OpenAI Compatible Endpoint
-@app.route('/v1/chat/completions', methods=['POST'])
-def chat_completions():
-    data = request.json
+@app.post('/v1/chat/completions')
+async def chat_completions(request: Request):
+    data = _loads(await request.body())
     messages = data.get('messages', [])
     last_msg = messages[-1]['content'] if messages else ""
     
     print(f"🤖 [Mock LLM] Received request: {last_msg[:50]}...")
     
     # Mock response
-    return jsonify({
-        "id": "chatcmpl-mock",
-        "object": "chat.completion",
-        "created": int(time.time()),
-        "choices": [{
-            "index": 0,
-            "message": {
-                "role": "assistant",
-                "content": get_smart_response(last_msg)
-            },
-            "finish_reason": "stop"
-        }],
-        "usage": {
-            "prompt_tokens": 10,
-            "completion_tokens": 10,
-            "total_tokens": 20
-        }
-    })
+    content = _dumps(get_smart_response(last_msg))
+    body = _COMPLETION_TEMPLATE % (int(time.time()), content)
+    return Response(body, media_type='application/json')
 
 # Ollama Compatible Endpoint
-@app.route('/api/chat', methods=['POST'])
-def ollama_chat():
-    data = request.json
+@app.post('/api/chat')
+async def ollama_chat(request: Request):
+    data = _loads(await request.body())
     messages = data.get('messages', [])
     last_msg = messages[-1]['content'] if messages else ""
+    model = data.get("model", "mock-model")
+
+    # The whole reply has no timestamp, so cache the serialized body
+    body = _cached(("ollama_chat", model, _digest(last_msg)), _ollama_chat_body, model, last_msg)
+    return Response(body, media_type='application/json')
 
+def _ollama_chat_body(model, last_msg):
     # Check for keywords to trigger specific behaviors
-    lower_msg = last_msg.lower()
+    found = _keywords(last_msg.lower())
     
     content = f"Mock Ollama response to: {last_msg[:20]}..."
     
     # 1. SPECIFIC SUCCESS CASES (Highest Priority)
     # Ensure this matches the smart_scrape prompt for example.com
-    if ("example" in lower_msg and "domain" in lower_msg) and ("title" in lower_msg or "find" in lower_msg):
+    if ("example" in found and "domain" in found) and ("title" in found or "find" in found):
         content = "Example Domain"
     
     # 2. HYPOTHESIS GENERATION / AGENT PLANNING
-    elif "generate 1 to 3" in lower_msg or "experiment ideas" in lower_msg or "json array of tool calls" in lower_msg or "scraper_agent" in lower_msg or ("plan" in lower_msg and "experiment" in lower_msg):
+    elif "generate 1 to 3" in found or "experiment ideas" in found or "json array of tool calls" in found or "scraper_agent" in found or ("plan" in found and "experiment" in found):
         content = """[
   {
     "description": "If we scrape the example.com domain, we will find the title is Example Domain.",
@@ -111,7 +189,7 @@ def ollama_chat():
 ]"""
     
     # 3. CODE GENERATION
-    elif ("write" in lower_msg or "generate" in lower_msg) and ("python code" in lower_msg or "calculate the" in lower_msg):
+    elif ("write" in found or "generate" in found) and ("python code" in found or "calculate the" in found):
         content = """Here is the Python code you requested:
 ```python
 print('Hello from Mock LLM Code Gen')
@@ -120,7 +198,7 @@ print(f'Result: {x}')
 ```"""
 
     # 4. SCRAPER CONFIGURATION PLANNING
-    elif ("plan" in lower_msg or "configure" in lower_msg) and ("scraper" in lower_msg or "scraping" in lower_msg):
+    elif ("plan" in found or "configure" in found) and ("scraper" in found or "scraping" in found):
         content = """```json
 {
   "typescript_config": "",
@@ -133,25 +211,25 @@ print(f'Result: {x}')
 
 
     # Behavior 4: Intent Classification
-    elif "classify" in lower_msg and "category" in lower_msg:
-        if "summarize" in lower_msg or "news" in lower_msg or "iran" in lower_msg:
+    elif "classify" in found and "category" in found:
+        if "summarize" in found or "news" in found or "iran" in found:
             content = "query"
-        elif "remember" in lower_msg or "my name is" in lower_msg:
+        elif "remember" in found or "my name is" in found:
             content = "personal_update"
         else:
             content = "general_conversation"
 
     # Behavior 5: Entity Extraction
-    elif "extract entities" in lower_msg or "return as json" in lower_msg:
-        if "iran" in lower_msg:
+    elif "extract entities" in found or "return as json" in found:
+        if "iran" in found:
             content = '{"query": "iran", "topic": "news"}'
-        elif "remember" in lower_msg:
+        elif "remember" in found:
             content = '{"content": "remember that I like coffee"}'
         else:
             content = '{}'
 
-    return jsonify({
-        "model": data.get("model", "mock-model"),
+    return _dumps({
+        "model": model,
         "created_at": "2023-01-01T00:00:00Z",
         "message": {
             "role": "assistant",
@@ -164,9 +242,9 @@ print(f'Result: {x}')
         "eval_count": 10
     })
 
-@app.route('/api/generate', methods=['POST'])
-def ollama_generate():
-    data = request.json
+@app.post('/api/generate')
+async def ollama_generate(request: Request):
+    data = _loads(await request.body())
     prompt = data.get('prompt', '').lower()
 
     print(f"🦙 [Mock Ollama Generate] Received request: {prompt[:50]}...")
@@ -201,19 +279,21 @@ def ollama_generate():
   }
 ]"""
 
-    return jsonify({
+    return _json_response({
         "model": data.get("model", "mock-model"),
         "created_at": "2023-01-01T00:00:00Z",
         "response": content,
         "done": True
     })
 
-@app.route('/api/embeddings', methods=['POST'])
-def ollama_embeddings():
-    return jsonify({
+@app.post('/api/embeddings')
+async def ollama_embeddings():
+    return _json_response({
         "embedding": [0.1] * 1024
     })
 
 if __name__ == '__main__':
+    import uvicorn
     port = int(os.environ.get('PORT', 11434))
-    app.run(host='0.0.0.0', port=port)
+    workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+    uvicorn.run('main:app', host='0.0.0.0', port=port, workers=workers)